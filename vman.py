@@ -1,43 +1,105 @@
 from __future__ import annotations
 
+# Only what the `run` fast path below needs; everything else is imported after it
 import os
+import pickle
+import sys
+from pathlib import Path
+
+# ------------------------------------------------------------
+# Fast path: `vman run TOOL NAME...` straight from the lookup snapshot,
+# before Typer/Rich (most of a cold start) are imported
+# ------------------------------------------------------------
+DB_PATH = Path(os.environ.get("MYMAN_DB", Path.home() / ".myman.db"))
+LOOKUP_CACHE = Path(os.environ.get("MYMAN_LOOKUP_CACHE", Path.home() / ".myman.lookup"))
+LOOKUP_MAX = 256
+
+def _db_stamp() -> Tuple:
+    # WAL writes land in the -wal file first, so both files make up the version.
+    # An empty -wal holds nothing (readers create one on open), so it counts as absent.
+    stamp = []
+    for p in (DB_PATH, Path(f"{DB_PATH}-wal")):
+        try:
+            st = p.stat()
+            stamp.append((st.st_mtime_ns, st.st_size) if st.st_size or p == DB_PATH else None)
+        except FileNotFoundError:
+            stamp.append(None)
+    return tuple(stamp)
+
+# iovecs per writev; POSIX guarantees at least 16, Linux/macOS allow 1024
+IOV_BATCH = 1024
+
+def _emit_snippet(data: bytes) -> None:
+    _emit_snippets([data])
+
+def _emit_snippets(blobs: List[bytes], end: bytes = b"\n") -> None:
+    """Write UTF-8 snippets to stdout, each followed by `end` (stored snippets carry no
+    trailing newline). Gathered with writev: no concat copies, one syscall per batch.
+    Callers encode once and share the bytes with _copy_clipboard."""
+    parts = []
+    for b in blobs:
+        parts.append(b)
+        parts.append(end)
+    sys.stdout.flush()  # keep order with anything Rich already printed
+    fd = sys.stdout.fileno()
+    for i in range(0, len(parts), IOV_BATCH):
+        batch = parts[i:i + IOV_BATCH]
+        done = os.writev(fd, batch)
+        # short write (signal, full pipe): finish the remainder with plain writes
+        for part in batch:
+            view = memoryview(part)[done:]
+            done = max(0, done - len(part))
+            while view:
+                view = view[os.write(fd, view):]
+
+def _fast_run(argv: List[str]) -> bool:
+    """Print the snippets for a plain `run TOOL NAME...` when every one is in a fresh
+    lookup snapshot. Anything else (options, misses, stale stamp) returns False and
+    goes through the full CLI, which also refreshes the snapshot."""
+    if len(argv) < 3 or argv[0] != "run" or any(a.startswith("-") for a in argv[1:]):
+        return False
+    try:
+        with LOOKUP_CACHE.open("rb") as f:
+            stamp, entries = pickle.load(f)
+        if stamp != _db_stamp():
+            return False
+        blobs = [entries[(argv[1], n)][0].encode("utf-8") for n in argv[2:]]
+    except Exception:  # missing/foreign snapshot or a name not in it
+        return False
+    _emit_snippets(blobs)
+    return True
+
+if __name__ == "__main__" and _fast_run(sys.argv[1:]):
+    sys.exit(0)
+
+import atexit
+import functools
+import hashlib
+import importlib.util
+import json
+import re
 import sqlite3
 import textwrap
 import shutil
 import subprocess
 import tempfile
-import sys
-from pathlib import Path
-from typing import Optional, List, Tuple
+from collections import defaultdict
+from typing import NamedTuple, NoReturn, Optional, List, Tuple
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.rule import Rule
+from rich.console import Console, Group
+# rich.table/panel/rule are imported where used: the default `run` path and
+# piped (TSV) output never render them
 
-# --- fuzzy deps ---
-try:
-    from rapidfuzz import process, fuzz
-    HAS_RF = True
-except Exception:  # RapidFuzz not installed
-    HAS_RF = False
+# --- fuzzy deps (imported inside the fuzzy helpers; only probe for it here) ---
+HAS_RF = importlib.util.find_spec("rapidfuzz") is not None
 
 # --- TUI imports ---
 import shutil
 from typing import Optional, List, Dict, Tuple
 
-# Textual (TUI)
-try:
-    from textual.app import App, ComposeResult
-    from textual.widgets import Header, Footer, Input, Static, ListView, ListItem, Label, Button
-    from textual.containers import Horizontal, Vertical
-    from textual.reactive import reactive
-    from textual.screen import ModalScreen
-    HAS_TEXTUAL = True
-except Exception:
-    HAS_TEXTUAL = False
+# Textual (TUI) costs ~100 ms to import; only `vman tui` loads it (see _tui_app)
+HAS_TEXTUAL = importlib.util.find_spec("textual") is not None
 
 # ------------------------------------------------------------
 # App setup
@@ -45,10 +107,12 @@ except Exception:
 app = typer.Typer(add_completion=False, help="Your personal, pretty, CLI man page.")
 console = Console()
 
-DB_PATH = Path(os.environ.get("MYMAN_DB", Path.home() / ".myman.db"))
+def _die(msg: str, code: int = 1) -> NoReturn:
+    """Print msg to stderr and exit with `code` (typer.Exit takes an int, not a message)."""
+    typer.echo(msg, err=True)
+    raise typer.Exit(code)
 
 SCHEMA = """
-PRAGMA foreign_keys=ON;
 CREATE TABLE IF NOT EXISTS tools(
   id INTEGER PRIMARY KEY,
   name TEXT UNIQUE NOT NULL,
@@ -61,8 +125,8 @@ CREATE TABLE IF NOT EXISTS tags(
 CREATE TABLE IF NOT EXISTS tool_tags(
   tool_id INTEGER NOT NULL REFERENCES tools(id) ON DELETE CASCADE,
   tag_id INTEGER NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
-  UNIQUE(tool_id, tag_id)
-);
+  PRIMARY KEY(tool_id, tag_id)
+) WITHOUT ROWID;
 CREATE TABLE IF NOT EXISTS commands(
   id INTEGER PRIMARY KEY,
   tool_id INTEGER NOT NULL REFERENCES tools(id) ON DELETE CASCADE,
@@ -71,54 +135,256 @@ CREATE TABLE IF NOT EXISTS commands(
   snippet TEXT,
   UNIQUE(tool_id, name)
 );
+-- tag -> tool lookups; the primary key only serves tool -> tag
+CREATE INDEX IF NOT EXISTS idx_tool_tags_tag_tool ON tool_tags(tag_id, tool_id);
+"""
+
+# `search --cmd X --exact` across all tools; UNIQUE(tool_id, name) only helps with a tool fixed
+COMMANDS_NAME_INDEX = "CREATE INDEX IF NOT EXISTS idx_commands_name ON commands(name)"
+
+# Full-text index over commands (rowid = commands.id), kept in sync by triggers.
+# Tool description rides along as the last column so tool-level matches still hit.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+  tool, cname, cdesc, snippet, tdesc, tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS commands_fts_ai AFTER INSERT ON commands BEGIN
+  INSERT INTO search_fts(rowid, tool, cname, cdesc, snippet, tdesc)
+  SELECT new.id, name, new.name, COALESCE(new.description, ''), COALESCE(new.snippet, ''),
+         COALESCE(description, '')
+  FROM tools WHERE id = new.tool_id;
+END;
+CREATE TRIGGER IF NOT EXISTS commands_fts_au AFTER UPDATE ON commands BEGIN
+  DELETE FROM search_fts WHERE rowid = old.id;
+  INSERT INTO search_fts(rowid, tool, cname, cdesc, snippet, tdesc)
+  SELECT new.id, name, new.name, COALESCE(new.description, ''), COALESCE(new.snippet, ''),
+         COALESCE(description, '')
+  FROM tools WHERE id = new.tool_id;
+END;
+CREATE TRIGGER IF NOT EXISTS commands_fts_ad AFTER DELETE ON commands BEGIN
+  DELETE FROM search_fts WHERE rowid = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS tools_fts_au AFTER UPDATE ON tools
+WHEN new.name IS NOT old.name OR new.description IS NOT old.description BEGIN
+  UPDATE search_fts SET tool = new.name, tdesc = COALESCE(new.description, '')
+  WHERE rowid IN (SELECT id FROM commands WHERE tool_id = new.id);
+END;
+"""
+
+FTS_BACKFILL = """
+INSERT INTO search_fts(rowid, tool, cname, cdesc, snippet, tdesc)
+SELECT commands.id, tools.name, commands.name, COALESCE(commands.description, ''),
+       COALESCE(commands.snippet, ''), COALESCE(tools.description, '')
+FROM commands JOIN tools ON tools.id = commands.tool_id
+"""
+
+# An empty description never clobbers an existing one
+UPSERT_TOOL_SQL = """
+INSERT INTO tools(name, description) VALUES(?, ?)
+ON CONFLICT(name) DO UPDATE SET
+  description=CASE WHEN excluded.description<>'' THEN excluded.description ELSE tools.description END"""
+
+# Snippets are stored without trailing newlines, so every output path appends exactly one
+UPSERT_COMMAND_SQL = """
+INSERT INTO commands(tool_id, name, description, snippet) VALUES(?,?,?,rtrim(?, char(13, 10)))
+ON CONFLICT(tool_id, name) DO UPDATE SET description=excluded.description, snippet=excluded.snippet
 """
 
+# Same upsert keyed by tool name: one statement, rowcount 0 means the tool is missing
+UPSERT_COMMAND_BY_NAME_SQL = """
+INSERT INTO commands(tool_id, name, description, snippet)
+SELECT id, ?, ?, rtrim(?, char(13, 10)) FROM tools WHERE name=?
+ON CONFLICT(tool_id, name) DO UPDATE SET description=excluded.description, snippet=excluded.snippet
+"""
+
+# Bump when SCHEMA changes and add a matching `if version < N:` step to ensure_schema().
+SCHEMA_VERSION = 4
+
+# v4: tool_tags was a rowid table plus a UNIQUE(tool_id, tag_id) btree; rebuild it
+# keyed on the pair itself, one btree instead of two
+TOOL_TAGS_REBUILD = [
+    """CREATE TABLE tool_tags_new(
+      tool_id INTEGER NOT NULL REFERENCES tools(id) ON DELETE CASCADE,
+      tag_id INTEGER NOT NULL REFERENCES tags(id) ON DELETE CASCADE,
+      PRIMARY KEY(tool_id, tag_id)
+    ) WITHOUT ROWID""",
+    "INSERT OR IGNORE INTO tool_tags_new(tool_id, tag_id) SELECT tool_id, tag_id FROM tool_tags",
+    "DROP TABLE tool_tags",
+    "ALTER TABLE tool_tags_new RENAME TO tool_tags",
+    "CREATE INDEX IF NOT EXISTS idx_tool_tags_tag_tool ON tool_tags(tag_id, tool_id)",
+]
+
+# Set by ensure_schema(); False when this SQLite build lacks FTS5.
+HAS_FTS = False
+SEARCH_LIMIT = 50
+# bm25 column weights for (tool, cname, cdesc, snippet, tdesc)
+SEARCH_RANK = "bm25(search_fts, 5.0, 3.0, 2.0, 1.0, 1.0)"
+
+# NORMAL is safe for a local WAL database; MYMAN_SYNC=FULL fsyncs every commit
+SYNC_MODE = os.environ.get("MYMAN_SYNC", "NORMAL").upper()
+if SYNC_MODE not in ("OFF", "NORMAL", "FULL", "EXTRA"):
+    SYNC_MODE = "NORMAL"
+
+# Per-connection settings (only journal_mode persists in the file), applied in one call
+CONN_PRAGMAS = f"""
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous={SYNC_MODE};
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-20000;
+PRAGMA busy_timeout=5000;
+PRAGMA foreign_keys=ON;
+"""
+
+# One connection per process: PRAGMA setup runs once and the page cache stays
+# warm across helpers. `with db() as conn:` only scopes a transaction.
+_CONN: Optional[sqlite3.Connection] = None
+
 def db() -> sqlite3.Connection:
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute("PRAGMA foreign_keys=ON;")
+    global _CONN
+    if _CONN is None:
+        if not DB_PATH.parent.is_dir():  # one stat on repeat runs instead of a failing mkdir + stat
+            DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # room for every distinct statement a long TUI/import session issues
+        conn = sqlite3.connect(DB_PATH, cached_statements=256)
+        conn.executescript(CONN_PRAGMAS)
+        atexit.register(_close, conn)
+        ensure_schema(conn)
+        _CONN = conn
+    return _CONN
+
+def db_ro() -> sqlite3.Connection:
+    """Read-only connection for one-shot lookups: no pragma script, no schema
+    setup, no atexit optimize. Raises sqlite3.OperationalError when the DB file
+    does not exist yet; callers fall back to db(), which creates it. A DB that
+    still needs an upgrade step gets db() instead, which runs it."""
+    conn = sqlite3.connect(f"{DB_PATH.resolve().as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA busy_timeout=5000")  # same wait as CONN_PRAGMAS before "database is locked"
+    if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+        conn.close()
+        return db()
+    conn.execute("PRAGMA mmap_size=268435456")
     return conn
 
-def ensure_schema():
-    with db() as conn:
-        conn.executescript(SCHEMA)
+def _close(conn: sqlite3.Connection):
+    # refresh planner stats for tables whose shape changed this run (cheap no-op otherwise)
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error:
+        pass
+    conn.close()
+
+def _executescript_in_txn(conn: sqlite3.Connection, script: str):
+    # executescript() commits any open transaction before it starts; feed the script
+    # one complete statement (trigger bodies included) at a time instead
+    stmt = ""
+    for line in script.splitlines(keepends=True):
+        stmt += line
+        if sqlite3.complete_statement(stmt):
+            conn.execute(stmt)
+            stmt = ""
+
+def ensure_schema(conn: sqlite3.Connection):
+    """Create/upgrade tables only when PRAGMA user_version is behind SCHEMA_VERSION."""
+    global HAS_FTS
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < SCHEMA_VERSION:
+        # Take the write lock before deciding anything, then look again: another
+        # process may have run the same upgrade while we waited. Everything below
+        # is then one transaction, committed once at the end.
+        conn.execute("BEGIN IMMEDIATE")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            conn.commit()
+    if version < 1:
+        fresh = not conn.execute("SELECT 1 FROM sqlite_master WHERE name='search_fts'").fetchone()
+        _executescript_in_txn(conn, SCHEMA)
+        try:
+            _executescript_in_txn(conn, FTS_SCHEMA)
+            if fresh:
+                conn.execute(FTS_BACKFILL)
+        except sqlite3.OperationalError as e:
+            if "fts5" not in str(e):
+                raise
+            # no fts5 module compiled in: the core schema is in place without it
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'").fetchone():
+            conn.execute("ANALYZE")  # one-shot planner statistics
+    if version < 2:
+        # v2: trailing newlines trimmed at write time (see UPSERT_COMMAND_SQL)
+        conn.execute(
+            "UPDATE commands SET snippet = rtrim(snippet, char(13, 10)) "
+            "WHERE snippet <> rtrim(snippet, char(13, 10))"
+        )
+    if version < 3:
+        conn.execute(COMMANDS_NAME_INDEX)
+    if version < 4 and "WITHOUT ROWID" not in conn.execute(
+        "SELECT upper(sql) FROM sqlite_master WHERE name='tool_tags'"
+    ).fetchone()[0]:  # new databases already got the v4 table from SCHEMA
+        for stmt in TOOL_TAGS_REBUILD:
+            conn.execute(stmt)
+    if version < SCHEMA_VERSION:
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.commit()
+    HAS_FTS = conn.execute("SELECT 1 FROM sqlite_master WHERE name='search_fts'").fetchone() is not None
+
+def _fts_query(q: str) -> str:
+    # quote each term so user input can't inject FTS5 operators; trailing * keeps
+    # LIKE's "doc" -> docker behaviour as an indexed prefix match
+    return " ".join('"' + t.replace('"', '""') + '"*' for t in q.split())
+
+# name -> id for tools seen in this process; rm-tool evicts
+_TOOL_IDS: Dict[str, int] = {}
+
+def _invalidate_tool(name: str):
+    _TOOL_IDS.pop(name, None)
 
 def ensure_tool(conn: sqlite3.Connection, name: str, description: str = "") -> int:
-    cur = conn.execute("SELECT id FROM tools WHERE name = ?", (name,))
-    row = cur.fetchone()
-    if row:
-        if description:
-            conn.execute("UPDATE tools SET description=? WHERE id=?", (description, row[0]))
-        return row[0]
-    cur = conn.execute("INSERT INTO tools(name, description) VALUES(?, ?)", (name, description))
-    return cur.lastrowid
-
-def ensure_tag(conn: sqlite3.Connection, tag: str) -> int:
-    cur = conn.execute("SELECT id FROM tags WHERE name = ?", (tag,))
-    row = cur.fetchone()
-    if row:
-        return row[0]
-    cur = conn.execute("INSERT INTO tags(name) VALUES(?)", (tag,))
-    return cur.lastrowid
+    _TOOL_IDS[name] = conn.execute(UPSERT_TOOL_SQL + " RETURNING id", (name, description)).fetchone()[0]
+    return _TOOL_IDS[name]
+
+# name -> id for tags seen in this process (tags are never deleted)
+_TAG_IDS: Dict[str, int] = {}
+
+def resolve_tags(conn: sqlite3.Connection, names: List[str]) -> Dict[str, int]:
+    """Map tag names to ids, creating missing tags in one batch."""
+    missing = [n for n in names if n not in _TAG_IDS]
+    if missing:
+        conn.executemany("INSERT OR IGNORE INTO tags(name) VALUES(?)", [(n,) for n in missing])
+        _TAG_IDS.update(conn.execute(
+            f"SELECT name, id FROM tags WHERE name IN ({','.join('?' * len(missing))})", missing
+        ).fetchall())
+    return {n: _TAG_IDS[n] for n in names}
 
 def attach_tags(conn: sqlite3.Connection, tool_id: int, tags: List[str]):
-    for t in tags:
-        t = t.strip()
-        if not t:
-            continue
-        tid = ensure_tag(conn, t)
-        conn.execute("INSERT OR IGNORE INTO tool_tags(tool_id, tag_id) VALUES(?, ?)", (tool_id, tid))
+    names = list(dict.fromkeys(t.strip() for t in tags if t.strip()))
+    if not names:
+        return
+    payload = json.dumps(names)
+    try:
+        # two statements whatever the tag count; json_each expands the list inside SQLite
+        conn.execute("INSERT OR IGNORE INTO tags(name) SELECT value FROM json_each(?)", (payload,))
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO tool_tags(tool_id, tag_id)
+            SELECT ?, id FROM tags WHERE name IN (SELECT value FROM json_each(?))
+            """,
+            (tool_id, payload),
+        )
+    except sqlite3.OperationalError:  # SQLite built without JSON1
+        tag_ids = resolve_tags(conn, names)
+        conn.executemany(
+            "INSERT OR IGNORE INTO tool_tags(tool_id, tag_id) VALUES(?, ?)",
+            [(tool_id, tag_ids[n]) for n in names],
+        )
 
 def get_tool_id(conn: sqlite3.Connection, name: str) -> Optional[int]:
+    if name in _TOOL_IDS:
+        return _TOOL_IDS[name]
     row = conn.execute("SELECT id FROM tools WHERE name=?", (name,)).fetchone()
-    return row[0] if row else None
-
-# ------------------------------------------------------------
-# Initialize schema on any run
-# ------------------------------------------------------------
-@app.callback()
-def _init():
-    ensure_schema()
+    if not row:
+        return None
+    _TOOL_IDS[name] = row[0]
+    return row[0]
 
 # ------------------------------------------------------------
 # Core commands
@@ -134,7 +400,7 @@ def add_tool(
         tool_id = ensure_tool(conn, name, description)
         attach_tags(conn, tool_id, tags)
         conn.commit()
-    console.print(Panel.fit(f"[bold]{name}[/] added/updated."))
+    _banner(f"[bold]{name}[/] added/updated.")
 
 @app.command("add-cmd")
 def add_cmd(
@@ -145,39 +411,119 @@ def add_cmd(
 ):
     """Add or update a command for a tool."""
     with db() as conn:
-        tool_id = get_tool_id(conn, tool)
-        if not tool_id:
-            raise typer.Exit(f"Tool '{tool}' not found. Add it first with add-tool.")
-        existing = conn.execute("SELECT id FROM commands WHERE tool_id=? AND name=?", (tool_id, name)).fetchone()
-        if existing:
-            conn.execute("UPDATE commands SET description=?, snippet=? WHERE id=?", (description, snippet, existing[0]))
-        else:
-            conn.execute(
-                "INSERT INTO commands(tool_id, name, description, snippet) VALUES(?,?,?,?)",
-                (tool_id, name, description, snippet),
-            )
+        if not conn.execute(UPSERT_COMMAND_BY_NAME_SQL, (name, description, snippet, tool)).rowcount:
+            _die(f"Tool '{tool}' not found. Add it first with add-tool.")
         conn.commit()
-    console.print(Panel.fit(f"[bold]{tool}[/] · command [bold]{name}[/] added/updated."))
+    _banner(f"[bold]{tool}[/] · command [bold]{name}[/] added/updated.")
+
+@functools.lru_cache(maxsize=1)
+def _bash_lexer():
+    # one Pygments lexer per process instead of a fresh lookup per Syntax block
+    from pygments.lexers.shell import BashLexer
+    return BashLexer()
+
+def _syntax(code: str):
+    # rich.syntax drags in Pygments; only show/run need it
+    from rich.syntax import Syntax
+    return Syntax(code, _bash_lexer(), word_wrap=True)
+
+PREVIEW_CACHE = Path(os.environ.get("MYMAN_PREVIEW_CACHE", Path.home() / ".myman.preview"))
+PREVIEW_MAX = 256
+
+@functools.lru_cache(maxsize=1)
+def _preview_cache() -> dict:
+    # loaded once per process; a run with several previews shares it
+    try:
+        with PREVIEW_CACHE.open("rb") as f:
+            return pickle.load(f)
+    except Exception:  # missing, truncated, or foreign: start over
+        return {}
+
+def _print_cached(kind: str, text: str, render) -> None:
+    """console.print(render()), replaying cached ANSI when `text` was already rendered
+    as `kind` at the same width/colour depth, so repeat previews skip Rich's layout
+    pass and, for snippets, never load Pygments."""
+    key = (
+        kind,
+        hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(),
+        console.width,
+        console.color_system,
+    )
+    rendered = _preview_cache()
+    ansi = rendered.get(key)
+    if ansi is None:
+        with console.capture() as cap:
+            console.print(render())
+        rendered[key] = ansi = cap.get()
+        while len(rendered) > PREVIEW_MAX:
+            del rendered[next(iter(rendered))]  # oldest insert first
+        _write_snapshot(PREVIEW_CACHE, rendered)
+    console.file.write(ansi)
+    console.file.flush()
+
+def _print_syntax(code: str) -> None:
+    _print_cached("syntax", code, lambda: _syntax(code))
+
+def _print_banner(msg: str) -> None:
+    _print_cached("banner", msg, lambda: _panel_fit(msg))
+
+# Past this many rows Rich's measure/wrap pass dominates; stream TSV instead
+PLAIN_ROWS = 200
+
+def _plain(rows: list) -> bool:
+    """True when a table should go out as TSV: piped output, or too big to lay out quickly."""
+    return len(rows) > PLAIN_ROWS or not console.is_terminal
+
+def _panel_fit(msg: str):
+    from rich.panel import Panel
+    return Panel.fit(msg)
+
+def _banner(msg: str) -> None:
+    console.print(_panel_fit(msg))
+
+def _write_tsv(rows) -> None:
+    clean = lambda v: str(v).replace("\t", " ").replace("\n", " ")
+    sys.stdout.write("".join("\t".join(map(clean, r)) + "\n" for r in rows))
+
+_LIST_BY_TAG_SQL = """
+SELECT tools.name, tools.description
+FROM tools
+JOIN tool_tags ON tool_tags.tool_id = tools.id
+JOIN tags ON tags.id = tool_tags.tag_id
+WHERE tags.name = ?
+ORDER BY tools.name
+"""
+
+# "a, b, c" tag list of the tool aliased `t`, NULL if untagged; one covering-index walk per tool
+_TOOL_TAGS_CSV = """(SELECT group_concat(name, ', ') FROM (
+  SELECT tags.name FROM tool_tags JOIN tags ON tags.id = tool_tags.tag_id
+  WHERE tool_tags.tool_id = t.id ORDER BY tags.name))"""
+
+_TOOL_SQL = f"SELECT t.id, t.name, t.description, {_TOOL_TAGS_CSV} FROM tools t WHERE t.name=?"
+
+_TOOL_CMDS_SQL = "SELECT name, description, snippet FROM commands WHERE tool_id=? ORDER BY name"
+
+# LIKE fallback (no FTS5): the searchable columns joined once per row, so each
+# query term costs one LIKE instead of five; terms have no spaces, so none can
+# match across a column boundary
+_SEARCH_HAYSTACK = (
+    "(tools.name || ' ' || COALESCE(tools.description, '') || ' ' || COALESCE(commands.name, '')"
+    " || ' ' || COALESCE(commands.description, '') || ' ' || COALESCE(commands.snippet, ''))"
+)
 
 @app.command("list")
 def list_tools(tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Filter by tag")):
     """List tools (optionally by tag)."""
     with db() as conn:
         if tag:
-            rows = conn.execute(
-                """
-                SELECT tools.name, tools.description
-                FROM tools
-                JOIN tool_tags ON tool_tags.tool_id = tools.id
-                JOIN tags ON tags.id = tool_tags.tag_id
-                WHERE tags.name = ?
-                ORDER BY tools.name
-                """,
-                (tag,),
-            ).fetchall()
+            rows = conn.execute(_LIST_BY_TAG_SQL, (tag,)).fetchall()
         else:
             rows = conn.execute("SELECT name, description FROM tools ORDER BY name").fetchall()
 
+    if _plain(rows):
+        _write_tsv((name, desc or "") for name, desc in rows)
+        return
+    from rich.table import Table
     table = Table(title="Tools", show_lines=False)
     table.add_column("Tool", style="bold")
     table.add_column("Description", overflow="fold")
@@ -197,6 +543,10 @@ def list_tags():
             ORDER BY tags.name
             """
         ).fetchall()
+    if _plain(rows):
+        _write_tsv(rows)
+        return
+    from rich.table import Table
     table = Table(title="Tags", show_lines=False)
     table.add_column("Tag", style="bold")
     table.add_column("Tools", justify="right")
@@ -208,40 +558,29 @@ def list_tags():
 def show_tool(name: str):
     """Show a tool with its tags and commands."""
     with db() as conn:
-        tool = conn.execute("SELECT id, name, description FROM tools WHERE name=?", (name,)).fetchone()
+        # tool and its tags in one statement, then its commands
+        tool = conn.execute(_TOOL_SQL, (name,)).fetchone()
         if not tool:
-            raise typer.Exit(f"Tool '{name}' not found.")
-        tool_id, tname, desc = tool
-        tags = [
-            r[0]
-            for r in conn.execute(
-                """
-                SELECT tags.name
-                FROM tags JOIN tool_tags ON tags.id=tool_tags.tag_id
-                WHERE tool_tags.tool_id=? ORDER BY tags.name
-                """,
-                (tool_id,),
-            ).fetchall()
-        ]
-        cmds = conn.execute(
-            "SELECT name, description, snippet FROM commands WHERE tool_id=? ORDER BY name",
-            (tool_id,),
-        ).fetchall()
+            _die(f"Tool '{name}' not found.")
+        tool_id, tname, desc, tags = tool
+        cmds = conn.execute(_TOOL_CMDS_SQL, (tool_id,)).fetchall()
 
+    # Collect renderables and emit them in one print/layout pass
+    from rich.panel import Panel
+    from rich.rule import Rule
     header = f"[bold]{tname}[/] — {desc}" if desc else f"[bold]{tname}[/]"
-    console.print(Panel(header))
+    parts = [Panel(header)]
     if tags:
-        console.print("[bold]Tags:[/]", ", ".join(tags))
-    console.print(Rule("Commands"))
+        parts.append(f"[bold]Tags:[/] {tags}")
+    parts.append(Rule("Commands"))
     if not cmds:
-        console.print("No commands yet.")
-        return
+        parts.append("No commands yet.")
     for cname, cdesc, snip in cmds:
-        console.print(f"[bold]{cname}[/]: {cdesc}")
+        parts.append(f"[bold]{cname}[/]: {cdesc}")
         if snip:
-            code = Syntax(snip, "bash", word_wrap=True)
-            console.print(code)
-        console.print()
+            parts.append(_syntax(snip))
+        parts.append("")
+    console.print(Group(*parts))
 
 @app.command("search")
 def search(
@@ -250,17 +589,42 @@ def search(
     tool: Optional[str] = typer.Option(None, "--tool", "-T", help="Restrict to this tool"),
     cmd: Optional[str]  = typer.Option(None, "--cmd", "-C", help="Restrict by command name"),
     exact: bool = typer.Option(False, "--exact", help="Use exact match for --cmd"),
+    limit: int = typer.Option(SEARCH_LIMIT, "--limit", "-n", help="Max results for ranked text search"),
 ):
     """Search tools/commands with optional filters by tag, tool, and command name."""
-    like = f"%{q}%" if q else None
+    db()  # opening the connection settles HAS_FTS
+    if q and q.strip() and HAS_FTS:
+        _search_fts(q, tag, tool, cmd, exact, limit)
+        return
+    terms = (q or "").split()
+    params = {"tag": tag, "tool": tool, "cmd": cmd if exact else f"%{cmd}%"}
+    params.update((f"q{i}", f"%{term}%") for i, term in enumerate(terms))
+    sql_str = _search_like_sql(len(terms), bool(tag), bool(tool), _cmd_mode(cmd, exact))
 
-    # Build query parts
+    with db() as conn:
+        rows = conn.execute(sql_str, params).fetchall()
+    _print_search(q, rows)
+
+def _cmd_mode(cmd: Optional[str], exact: bool) -> Optional[str]:
+    return None if not cmd else "exact" if exact else "like"
+
+# The SQL builders below are memoized per filter shape: the text is assembled
+# once per shape and stays byte-identical, so sqlite3 reuses its prepared statement.
+
+def _summary_sql(desc: str, snip: str, width: int = 60) -> str:
+    # description, else the snippet cut to `width` chars: computed by SQLite per row, not in Python
+    return (
+        f"COALESCE(NULLIF({desc}, ''), CASE WHEN length({snip}) > {width}"
+        f" THEN substr({snip}, 1, {width}) || '…' ELSE COALESCE({snip}, '') END)"
+    )
+
+@functools.lru_cache(maxsize=None)
+def _search_like_sql(n_terms: int, tag: bool, tool: bool, cmd_mode: Optional[str]) -> str:
     sql = [
         "SELECT tools.name, COALESCE(commands.name, ''),",
-        "       COALESCE(commands.snippet, ''), COALESCE(commands.description, '')",
+        f"       {_summary_sql('commands.description', 'commands.snippet')}",
         "FROM tools",
     ]
-    params = []
     conditions = []
 
     if tag:
@@ -271,74 +635,130 @@ def search(
 
     sql += ["LEFT JOIN commands ON commands.tool_id = tools.id"]
 
-    if like:
-        conditions.append(
-            "("
-            "tools.name LIKE ? OR tools.description LIKE ? OR "
-            "commands.name LIKE ? OR commands.description LIKE ? OR commands.snippet LIKE ?"
-            ")"
-        )
-        params.extend([like, like, like, like, like])
+    # every term must appear somewhere in the row, as with the FTS path
+    conditions += [f"{_SEARCH_HAYSTACK} LIKE :q{i}" for i in range(n_terms)]
 
     if tag:
-        conditions.append("tags.name = ?")
-        params.append(tag)
+        conditions.append("tags.name = :tag")
 
     if tool:
-        conditions.append("tools.name = ?")
-        params.append(tool)
+        conditions.append("tools.name = :tool")
 
-    if cmd:
-        if exact:
-            conditions.append("commands.name = ?")
-            params.append(cmd)
-        else:
-            conditions.append("commands.name LIKE ?")
-            params.append(f"%{cmd}%")
+    if cmd_mode:
+        conditions.append("commands.name = :cmd" if cmd_mode == "exact" else "commands.name LIKE :cmd")
 
     sql_str = "\n".join(sql)
     if conditions:
         sql_str += "\nWHERE " + " AND ".join(conditions)
-    sql_str += "\nORDER BY tools.name, commands.name"
+    return sql_str + "\nORDER BY tools.name, commands.name"
 
-    with db() as conn:
-        rows = conn.execute(sql_str, params).fetchall()
+@functools.lru_cache(maxsize=None)
+def _search_fts_sql(tag: bool, tool: bool, cmd_mode: Optional[str]) -> str:
+    sql = [
+        f"SELECT tool, cname, {_summary_sql('cdesc', 'snippet')} AS summary, {SEARCH_RANK} AS r",
+        "FROM search_fts WHERE search_fts MATCH ?",
+    ]
+    if tool:
+        sql.append("AND tool = ?")
+    if cmd_mode:
+        sql.append("AND cname = ?" if cmd_mode == "exact" else "AND cname LIKE ?")
+    if tag:
+        # The tag's tools as an uncorrelated list checked per MATCH hit, before the
+        # LIMIT: joining tags into this WHERE lets the planner drop the FTS index,
+        # and filtering after a limited MATCH loses tagged hits ranked past the cut.
+        sql.append(
+            "AND tool IN (SELECT tools.name FROM tags"
+            " JOIN tool_tags ON tool_tags.tag_id = tags.id"
+            " JOIN tools ON tools.id = tool_tags.tool_id WHERE tags.name = ?)"
+        )
+    sql.append("ORDER BY r LIMIT ?")
+    return "\n".join(sql)
+
+@functools.lru_cache(maxsize=None)
+def _search_bare_tools_sql(n_terms: int, tag: bool, tool: bool) -> str:
+    # search_fts holds one row per command, so tools without commands are matched
+    # here the way the LIKE path matches them: same haystack, same (tool, '', '') row
+    sql = ["SELECT tools.name, '', '' FROM tools"]
+    if tag:
+        sql += [
+            "JOIN tool_tags ON tool_tags.tool_id = tools.id",
+            "JOIN tags ON tags.id = tool_tags.tag_id",
+        ]
+    sql.append("LEFT JOIN commands ON commands.tool_id = tools.id")
+    conditions = ["commands.id IS NULL"]
+    conditions += [f"{_SEARCH_HAYSTACK} LIKE :q{i}" for i in range(n_terms)]
+    if tag:
+        conditions.append("tags.name = :tag")
+    if tool:
+        conditions.append("tools.name = :tool")
+    return "\n".join(sql) + "\nWHERE " + " AND ".join(conditions) + "\nORDER BY tools.name LIMIT :limit"
 
-    if not rows:
+def _search_fts(q: str, tag: Optional[str], tool: Optional[str], cmd: Optional[str], exact: bool, limit: int):
+    """Ranked full-text search through search_fts; same filters as the LIKE path."""
+    params = [_fts_query(q)]
+    if tool:
+        params.append(tool)
+    if cmd:
+        params.append(cmd if exact else f"%{cmd}%")
+    if tag:
+        params.append(tag)
+    params.append(limit)
+
+    with db() as conn:
+        rows = [r[:3] for r in conn.execute(_search_fts_sql(bool(tag), bool(tool), _cmd_mode(cmd, exact)), params).fetchall()]
+        if not cmd and len(rows) < limit:  # a --cmd filter never matches a tool without commands
+            terms = q.split()
+            bare = {"tag": tag, "tool": tool, "limit": limit - len(rows)}
+            bare.update((f"q{i}", f"%{term}%") for i, term in enumerate(terms))
+            rows += conn.execute(_search_bare_tools_sql(len(terms), bool(tag), bool(tool)), bare).fetchall()
+    _print_search(q, rows)
+
+def _print_search(q: Optional[str], out: List[Tuple[str, str, str]]):
+    """Render (tool, command, summary) rows; the summary comes precomputed from SQL."""
+    if not out:
         console.print("No results.")
         raise typer.Exit(0)
 
+    if _plain(out):
+        _write_tsv(out)
+        return
+    from rich.table import Table
     table = Table(title=f"Search: {q or '*'}", show_lines=False)
     table.add_column("Tool", style="bold")
     table.add_column("Command")
     table.add_column("Summary")
-    for tool_name, cname, snip, cdesc in rows:
-        summary = cdesc or (snip[:60] + "…" if snip and len(snip) > 60 else snip)
-        table.add_row(tool_name, cname, summary or "")
+    for row in out:
+        table.add_row(*row)
     console.print(table)
 
+@app.command("reindex")
+def reindex():
+    """Rebuild the full-text search index from the tools/commands tables."""
+    with db() as conn:
+        if not HAS_FTS:
+            console.print("[yellow]This SQLite build has no FTS5; search uses LIKE.[/]")
+            raise typer.Exit(0)
+        conn.execute("DELETE FROM search_fts")
+        n = conn.execute(FTS_BACKFILL).rowcount
+    console.print(f"[green]Reindexed[/] {n} commands")
+
 @app.command("rm-tool")
 def rm_tool(name: str):
     """Delete a tool (and its commands)."""
     with db() as conn:
         conn.execute("DELETE FROM tools WHERE name=?", (name,))
         conn.commit()
+    _invalidate_tool(name)
     console.print(f"Removed tool: [bold]{name}[/].")
 
 @app.command("rm-cmd")
 def rm_cmd(tool: str, name: str):
     """Delete a command from a tool."""
     with db() as conn:
+        # two point lookups: tools(name) then the (tool_id, name) UNIQUE index
         conn.execute(
-            """
-            DELETE FROM commands
-            WHERE id IN (
-              SELECT commands.id
-              FROM commands JOIN tools ON tools.id=commands.tool_id
-              WHERE tools.name=? AND commands.name=?
-            )
-            """,
-            (tool, name),
+            "DELETE FROM commands WHERE name=? AND tool_id=(SELECT id FROM tools WHERE name=?)",
+            (name, tool),
         )
         conn.commit()
     console.print(f"Removed [bold]{tool}[/] · command [bold]{name}[/].")
@@ -346,62 +766,193 @@ def rm_cmd(tool: str, name: str):
 @app.command("export-md")
 def export_md(output: Path = typer.Argument(..., help="Markdown file to write")):
     """Export your library to a single pretty Markdown file."""
+    # Two bulk queries: tools carry their tag list, commands are grouped in Python
+    cmds_by_tool = defaultdict(list)
     with db() as conn:
-        tools = conn.execute("SELECT id, name, description FROM tools ORDER BY name").fetchall()
-        with output.open("w", encoding="utf-8") as f:
-            f.write("# My Personal Man Page\n\n")
-            for tool_id, name, desc in tools:
-                f.write(f"## {name}\n\n")
-                if desc:
-                    f.write(f"{desc}\n\n")
-                tags = [
-                    r[0]
-                    for r in conn.execute(
-                        """
-                        SELECT tags.name
-                        FROM tags JOIN tool_tags ON tags.id=tool_tags.tag_id
-                        WHERE tool_tags.tool_id=? ORDER BY tags.name
-                        """,
-                        (tool_id,),
-                    ).fetchall()
-                ]
-                if tags:
-                    f.write(f"**Tags:** {', '.join(tags)}\n\n")
-                cmds = conn.execute(
-                    "SELECT name, description, snippet FROM commands WHERE tool_id=? ORDER BY name",
-                    (tool_id,),
-                ).fetchall()
-                if not cmds:
-                    f.write("_No commands yet._\n\n")
-                else:
-                    for cname, cdesc, snip in cmds:
-                        f.write(f"### {cname}\n\n")
-                        if cdesc:
-                            f.write(f"{cdesc}\n\n")
-                        if snip:
-                            f.write("```bash\n")
-                            f.write(snip.strip() + "\n")
-                            f.write("```\n\n")
-    console.print(Panel.fit(f"Exported to [bold]{output}[/]."))
+        tools = conn.execute(
+            f"SELECT t.id, t.name, t.description, {_TOOL_TAGS_CSV} FROM tools t ORDER BY t.name"
+        ).fetchall()
+        for tool_id, cname, cdesc, snip in conn.execute(
+            "SELECT tool_id, name, description, snippet FROM commands ORDER BY tool_id, name"
+        ):
+            cmds_by_tool[tool_id].append((cname, cdesc, snip))
+
+    parts: List[str] = ["# My Personal Man Page\n\n"]
+    add = parts.append
+    for tool_id, name, desc, tags in tools:
+        add(f"## {name}\n\n")
+        if desc:
+            add(f"{desc}\n\n")
+        if tags:
+            add(f"**Tags:** {tags}\n\n")
+        cmds = cmds_by_tool.get(tool_id)
+        if not cmds:
+            add("_No commands yet._\n\n")
+        else:
+            for cname, cdesc, snip in cmds:
+                add(f"### {cname}\n\n")
+                if cdesc:
+                    add(f"{cdesc}\n\n")
+                if snip:
+                    add(f"```bash\n{snip.strip()}\n```\n\n")
+    # one join, one encode, one write; encoding each part for a binary writelines is slower
+    output.write_text("".join(parts), encoding="utf-8")
+    _banner(f"Exported to [bold]{output}[/].")
 
 # ------------------------------------------------------------
 # Convenience features
 # ------------------------------------------------------------
 CONTEXT_PATH = Path(os.environ.get("MYMAN_CONTEXT_FILE", Path.home() / ".myman.context"))
 
+# (st_mtime_ns, value) of the context file as last read or written; a stat
+# decides whether the cached value is still current
+_CONTEXT: Optional[Tuple[Optional[int], Optional[str]]] = None
+
+def _context_mtime() -> Optional[int]:
+    try:
+        return CONTEXT_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 def _set_context(name: str):
-    CONTEXT_PATH.write_text((name or "").strip() + "\n", encoding="utf-8")
+    global _CONTEXT
+    value = (name or "").strip()
+    # write-then-rename so a concurrent reader never sees a half-written file
+    target = CONTEXT_PATH.resolve()
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=".myman.context.")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(value + "\n")
+    os.replace(tmp, target)
+    _CONTEXT = (_context_mtime(), value or None)
 
 def _get_context() -> Optional[str]:
+    global _CONTEXT
+    mtime = _context_mtime()
+    if _CONTEXT is None or _CONTEXT[0] != mtime:
+        try:
+            value = CONTEXT_PATH.read_text(encoding="utf-8").strip() or None
+        except FileNotFoundError:
+            value = None
+        _CONTEXT = (mtime, value)
+    return _CONTEXT[1]
+
+def _confirm(msg: str) -> bool:
+    """y/N prompt for the exec paths: one line from stdin, anything but y/yes (or EOF) is no.
+    Reads the whole line so no stray newline is left for the exec'd command."""
+    sys.stdout.write(f"{msg} [y/N]: ")
+    sys.stdout.flush()
+    return sys.stdin.readline().strip().lower() in ("y", "yes")
+
+# Anything a shell would interpret: quoting, expansion, globbing, redirection,
+# pipes/lists, comments, assignments, line breaks
+_SHELL_CHARS = frozenset("|&;<>()$`\\\"'*?[]{}~#=!\n")
+# Builtins that mean nothing (or something else) as a standalone program
+_SHELL_BUILTINS = frozenset(
+    "cd pushd popd export unset set source . alias unalias eval exec exit "
+    "ulimit umask shift trap wait builtin command type hash".split()
+)
+
+def _direct_argv(snippet: str) -> Optional[List[str]]:
+    """argv for running `snippet` without a shell, or None when it needs one.
+
+    A plain `prog arg arg` line whose program is on PATH means the same thing
+    exec'd directly, minus a login shell's startup (sourcing the profile)."""
+    if any(c in _SHELL_CHARS for c in snippet):
+        return None
+    argv = snippet.split()
+    if not argv or argv[0] in _SHELL_BUILTINS:
+        return None
+    exe = _which(argv[0])
+    return [exe, *argv[1:]] if exe else None
+
+def _shell_argv(shell: str, snippet: str) -> List[str]:
+    return _direct_argv(snippet) or [shell, "-lc", snippet]
+
+def _exec_shell(shell: str, snippet: str):
+    """Hand the process over to the snippet (exec, no fork+wait); its exit code is ours.
+    Runs under `shell -lc` unless it is a plain command line (see _direct_argv)."""
+    argv = _shell_argv(shell, snippet)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if _CONN is not None:
+        _close(_CONN)  # atexit hooks don't run across exec
     try:
-        val = CONTEXT_PATH.read_text(encoding="utf-8").strip()
-        return val or None
-    except FileNotFoundError:
+        os.execvp(argv[0], argv)
+    except OSError as e:
+        # execvp only returns on failure; exit like a shell would (127 not found, 126 not runnable)
+        _die(f"Cannot run {argv[0]}: {e.strerror}", 127 if isinstance(e, FileNotFoundError) else 126)
+
+def _spawn_shell(shell: str, snippet: str) -> int:
+    """Run the snippet as a child (as _exec_shell would) and return its exit code. For callers
+    that must outlive the command (the TUI); posix_spawn skips fork's copy of our page tables."""
+    argv = _shell_argv(shell, snippet)
+    try:
+        pid = os.posix_spawnp(argv[0], argv, os.environ)
+    except OSError as e:
+        return 127 if isinstance(e, FileNotFoundError) else 126
+    _, status = os.waitpid(pid, 0)
+    if hasattr(os, "waitstatus_to_exitcode"):  # 3.9+
+        return os.waitstatus_to_exitcode(status)
+    return os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    # PATH lookup once per process; a missing pbcopy/pbpaste skips the fork entirely
+    return shutil.which(cmd)
+
+@functools.lru_cache(maxsize=1)
+def _pasteboard():
+    # PyObjC, when installed, talks to the pasteboard in-process; pbcopy/pbpaste
+    # are thin wrappers over the same API but cost a fork+exec per call
+    try:
+        from AppKit import NSPasteboard
+    except Exception:  # not macOS or no pyobjc
         return None
+    return NSPasteboard.generalPasteboard()
+
+_PB_TEXT = "public.utf8-plain-text"
+
+def _copy_clipboard(text: str, data: Optional[bytes] = None) -> bool:
+    """Put text on the clipboard; `data` is text already UTF-8 encoded, if the caller has it."""
+    pb = _pasteboard()
+    if pb is not None:
+        pb.clearContents()
+        if pb.setString_forType_(text, _PB_TEXT):
+            return True
+    exe = _which("pbcopy")
+    if not exe:
+        return False
+    try:
+        subprocess.run([exe], input=text.encode("utf-8") if data is None else data, check=True)
+        return True
+    except Exception:
+        return False
+
+def _paste_clipboard() -> Optional[str]:
+    pb = _pasteboard()
+    if pb is not None:
+        text = pb.stringForType_(_PB_TEXT)
+        if text is not None:
+            return str(text)
+    exe = _which("pbpaste")
+    if not exe:
+        return None
+    try:
+        return subprocess.check_output([exe]).decode()
+    except Exception:
+        return None
+
+_TAG_SPLIT = re.compile(r"[,\s]+")
+
+# "[tool.]name: desc [| snippet]" in one pass
+_QCMD_RE = re.compile(
+    r"^\s*(?:(?P<tool>[^.:]+)\.)?(?P<name>[^:]+):\s*(?P<desc>[^|]*?)(?:\|\s*(?P<snip>.*))?$",
+    re.DOTALL,
+)
 
 def _split_tags(s: str) -> List[str]:
-    # supports "#a,b" or "a, b"
-    return [t.strip().lstrip("#") for t in s.split(",") if t.strip()]
+    # supports "#a,b", "a, b" or "a b"
+    return [t for t in (p.lstrip("#") for p in _TAG_SPLIT.split(s)) if t]
 
 @app.command("use")
 def use_tool(
@@ -416,7 +967,7 @@ def use_tool(
             attach_tags(conn, tid, tags)
         conn.commit()
     _set_context(name)
-    console.print(Panel.fit(f"Default tool set to [bold]{name}[/]."))
+    _banner(f"Default tool set to [bold]{name}[/].")
 
 @app.command("cmd")
 def cmd_short(
@@ -429,26 +980,18 @@ def cmd_short(
     """Add/update a command, preferring the default tool set via `vman use`."""
     t = tool or _get_context()
     if not t:
-        raise typer.Exit("No default tool. Run: vman use <tool> [--desc ... --tag ...] OR pass --tool.")
+        _die("No default tool. Run: vman use <tool> [--desc ... --tag ...] OR pass --tool.")
     if clip and not snippet:
-        try:
-            snippet = subprocess.check_output(["pbpaste"]).decode()
-        except Exception:
-            raise typer.Exit("Clipboard read failed. Provide --run or remove --clip.")
+        snippet = _paste_clipboard()
+        if snippet is None:
+            _die("Clipboard read failed. Provide --run or remove --clip.")
     with db() as conn:
-        tool_id = get_tool_id(conn, t)
-        if not tool_id:
-            raise typer.Exit(f"Tool '{t}' not found. Create it with: vman add-tool {t} --desc ...")
-        existing = conn.execute("SELECT id FROM commands WHERE tool_id=? AND name=?", (tool_id, name)).fetchone()
-        if existing:
-            conn.execute("UPDATE commands SET description=?, snippet=? WHERE id=?", (description, snippet, existing[0]))
-        else:
-            conn.execute(
-                "INSERT INTO commands(tool_id, name, description, snippet) VALUES(?,?,?,?)",
-                (tool_id, name, description, snippet),
-            )
+        if not conn.execute(UPSERT_COMMAND_BY_NAME_SQL, (name, description, snippet, t)).rowcount:
+            _die(f"Tool '{t}' not found. Create it with: vman add-tool {t} --desc ...")
         conn.commit()
-    console.print(Panel.fit(f"Added/updated [bold]{t}[/] · command [bold]{name}[/]."))
+    _banner(f"Added/updated [bold]{t}[/] · command [bold]{name}[/].")
+
+WIZARD_BATCH = 32
 
 @app.command("wizard")
 def wizard(
@@ -460,34 +1003,41 @@ def wizard(
     tags_line = typer.prompt("Tags (comma-separated, optional)", default="")
     tags = _split_tags(tags_line)
 
-    with db() as conn:
+    conn = db()
+    with conn:  # commits on exit
         tid = ensure_tool(conn, t, desc)
         attach_tags(conn, tid, tags)
-        conn.commit()
     _set_context(t)
-    console.print(Panel.fit(f"Tool [bold]{t}[/] saved. Context set. Let's add commands..."))
-
-    while True:
-        cname = typer.prompt("Command name (e.g., init, list)", default="")
-        if not cname:
-            break
-        cdesc = typer.prompt("Command description", default="")
-        snip = typer.prompt("Command snippet (paste the exact command)", default="")
-        with db() as conn:
-            tool_id = get_tool_id(conn, t)
-            existing = conn.execute("SELECT id FROM commands WHERE tool_id=? AND name=?", (tool_id, cname)).fetchone()
-            if existing:
-                conn.execute("UPDATE commands SET description=?, snippet=? WHERE id=?", (cdesc, snip, existing[0]))
-            else:
-                conn.execute(
-                    "INSERT INTO commands(tool_id, name, description, snippet) VALUES(?,?,?,?)",
-                    (tool_id, cname, cdesc, snip),
-                )
-            conn.commit()
-        console.print(f"Saved command [bold]{cname}[/].")
-        if not typer.confirm("Add another command?", default=True):
-            break
-    console.print("Done.")
+    _banner(f"Tool [bold]{t}[/] saved. Context set. Let's add commands...")
+
+    # Queue entries and write them in batches rather than one transaction each;
+    # whatever is queued still gets written if the prompts are aborted.
+    pending: List[Tuple[int, str, str, str]] = []
+    saved = 0
+
+    def flush():
+        nonlocal saved
+        if pending:
+            with conn:
+                conn.executemany(UPSERT_COMMAND_SQL, pending)
+            saved += len(pending)
+            pending.clear()
+
+    try:
+        while True:
+            cname = typer.prompt("Command name (e.g., init, list)", default="")
+            if not cname:
+                break
+            cdesc = typer.prompt("Command description", default="")
+            snip = typer.prompt("Command snippet (paste the exact command)", default="")
+            pending.append((tid, cname, cdesc, snip))
+            if len(pending) >= WIZARD_BATCH:
+                flush()
+            if not typer.confirm("Add another command?", default=True):
+                break
+    finally:
+        flush()
+    _banner(f"Saved {saved} command(s) for [bold]{t}[/].")
 
 @app.command("qtool")
 def qtool(
@@ -509,7 +1059,7 @@ def qtool(
         attach_tags(conn, tid, tags)
         conn.commit()
     _set_context(name)
-    console.print(Panel.fit(f"Tool [bold]{name}[/] saved. Context set."))
+    _banner(f"Tool [bold]{name}[/] saved. Context set.")
 
 @app.command("qcmd")
 def qcmd(
@@ -517,42 +1067,25 @@ def qcmd(
     tool: Optional[str] = typer.Option(None, "--tool", "-T", help="Override default tool if not in spec"),
 ):
     """Quickly add/update a command from a compact spec."""
-    if ":" not in spec:
-        raise typer.Exit("Expected ':' in spec. Example: 'tool.cmd: Desc | snippet'")
-    left, right = spec.split(":", 1)
-    left = left.strip()
-    desc = ""
-    snippet = ""
-    if "|" in right:
-        desc, snippet = right.split("|", 1)
-    else:
-        desc = right
-    desc = desc.strip()
-    snippet = snippet.strip()
-
-    if "." in left:
-        t, cname = left.split(".", 1)
-        t = t.strip()
+    m = _QCMD_RE.match(spec)
+    if not m:
+        _die("Expected ':' in spec. Example: 'tool.cmd: Desc | snippet'")
+    cname = m["name"].strip()
+    desc = m["desc"].strip()
+    snippet = (m["snip"] or "").strip()
+
+    if m["tool"]:
+        t = m["tool"].strip()
     else:
         t = tool or _get_context()
         if not t:
-            raise typer.Exit("No tool in spec and no default tool set. Use `vman use <tool>` or pass --tool.")
-        cname = left.strip()
+            _die("No tool in spec and no default tool set. Use `vman use <tool>` or pass --tool.")
 
     with db() as conn:
-        tool_id = get_tool_id(conn, t)
-        if not tool_id:
-            raise typer.Exit(f"Tool '{t}' not found. Create it with: vman add-tool {t} --desc ...")
-        existing = conn.execute("SELECT id FROM commands WHERE tool_id=? AND name=?", (tool_id, cname)).fetchone()
-        if existing:
-            conn.execute("UPDATE commands SET description=?, snippet=? WHERE id=?", (desc, snippet, existing[0]))
-        else:
-            conn.execute(
-                "INSERT INTO commands(tool_id, name, description, snippet) VALUES(?,?,?,?)",
-                (tool_id, cname, desc, snippet),
-            )
+        if not conn.execute(UPSERT_COMMAND_BY_NAME_SQL, (cname, desc, snippet, t)).rowcount:
+            _die(f"Tool '{t}' not found. Create it with: vman add-tool {t} --desc ...")
         conn.commit()
-    console.print(Panel.fit(f"[bold]{t}[/] · [bold]{cname}[/] saved."))
+    _banner(f"[bold]{t}[/] · [bold]{cname}[/] saved.")
 
 # Optional: Bulk import via TOML (py3.11+), falls back to tomli if installed
 try:
@@ -592,92 +1125,241 @@ tags = ["password", "manage", "database"]
 def import_toml(path: Path):
     """Import many tools/commands from a TOML file."""
     if tomllib is None:
-        raise typer.Exit("TOML parser not available. Use Python 3.11+ or `pip install tomli` in your venv.")
-    data = tomllib.loads(path.read_text(encoding="utf-8"))
+        _die("TOML parser not available. Use Python 3.11+ or `pip install tomli` in your venv.")
+    # binary load: tomllib decodes the UTF-8 itself, skipping read_text's newline translation
+    with path.open("rb") as f:
+        data = tomllib.load(f)
     tools = data.get("tools", [])
-    count_tools = 0
-    count_cmds = 0
+    if not tools:
+        _banner("Imported 0 tool(s), 0 command(s).")
+        return
+
+    # Collect everything up front, then write in a handful of executemany calls
+    tool_rows = [(t["name"], t.get("description", "")) for t in tools]
+    names = sorted({name for name, _ in tool_rows})
+    tag_names = sorted({tag.strip() for t in tools for tag in t.get("tags", []) if tag.strip()})
+    count_cmds = sum(len(t.get("commands", [])) for t in tools)
+
     with db() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(UPSERT_TOOL_SQL, tool_rows)
+        tool_ids = dict(conn.execute(
+            f"SELECT name, id FROM tools WHERE name IN ({','.join('?' * len(names))})", names
+        ).fetchall())
+        _TOOL_IDS.update(tool_ids)
+
+        tag_ids = resolve_tags(conn, tag_names)
+
+        link_rows = []
+        cmd_rows = []
         for t in tools:
-            name = t["name"]
-            desc = t.get("description", "")
-            tags = t.get("tags", [])
-            tid = ensure_tool(conn, name, desc)
-            attach_tags(conn, tid, tags)
-            for c in t.get("commands", []):
-                cname = c["name"]
-                cdesc = c.get("description", "")
-                snip = c.get("snippet", "")
-                existing = conn.execute(
-                    "SELECT id FROM commands WHERE tool_id=? AND name=?", (tid, cname)
-                ).fetchone()
-                if existing:
-                    conn.execute("UPDATE commands SET description=?, snippet=? WHERE id=?", (cdesc, snip, existing[0]))
-                else:
-                    conn.execute(
-                        "INSERT INTO commands(tool_id, name, description, snippet) VALUES(?,?,?,?)",
-                        (tid, cname, cdesc, snip),
-                    )
-                count_cmds += 1
-            count_tools += 1
+            tid = tool_ids[t["name"]]
+            link_rows += [(tid, tag_ids[tag.strip()]) for tag in t.get("tags", []) if tag.strip()]
+            cmd_rows += [
+                (tid, c["name"], c.get("description", ""), c.get("snippet", ""))
+                for c in t.get("commands", [])
+            ]
+        conn.executemany("INSERT OR IGNORE INTO tool_tags(tool_id, tag_id) VALUES(?, ?)", link_rows)
+        conn.executemany(UPSERT_COMMAND_SQL, cmd_rows)
         conn.commit()
-    console.print(Panel.fit(f"Imported {count_tools} tool(s), {count_cmds} command(s)."))
+    _banner(f"Imported {len(tools)} tool(s), {count_cmds} command(s).")
 
 # ------------------------------------------------------------
 # Fuzzfinder
 # ------------------------------------------------------------
 
-def _build_catalog(conn: sqlite3.Connection, tool: Optional[str] = None, tag: Optional[str] = None):
-    """
-    Return a list of items: {tool, cmd, desc, snippet, summary, search}
-    """
+# "tool cmd desc snippet", empty parts skipped, as the text RapidFuzz scores
+_CATALOG_SEARCH = (
+    "tools.name || ' ' || commands.name"
+    " || CASE WHEN commands.description <> '' THEN ' ' || commands.description ELSE '' END"
+    " || CASE WHEN commands.snippet <> '' THEN ' ' || commands.snippet ELSE '' END"
+)
+
+@functools.lru_cache(maxsize=None)
+def _catalog_sql(scored: bool, tag: bool, tool: bool) -> str:
     sql = [
         "SELECT tools.name AS tool, commands.name AS cmd,",
-        "       COALESCE(commands.description, ''), COALESCE(commands.snippet, '')",
+        "       COALESCE(commands.description, ''), COALESCE(commands.snippet, ''),",
+        f"       {_summary_sql('commands.description', 'commands.snippet', 80)},",
+        f"       {_CATALOG_SEARCH}",
         "FROM tools",
         "LEFT JOIN commands ON commands.tool_id = tools.id",
     ]
-    params = []
+    if scored:
+        # last column, so _build_catalog's trailing *score picks it up
+        sql[3] += ","
+        sql.insert(4, "       wratio(?, tools.name, commands.name, commands.description, commands.snippet) AS score")
     if tag:
-        sql.insert(3, "JOIN tool_tags ON tool_tags.tool_id = tools.id")
-        sql.insert(4, "JOIN tags ON tags.id = tool_tags.tag_id")
+        sql.insert(-1, "JOIN tool_tags ON tool_tags.tool_id = tools.id")
+        sql.insert(-1, "JOIN tags ON tags.id = tool_tags.tag_id")
 
-    where = []
+    where = ["commands.id IS NOT NULL"]  # tools without commands have nothing to pick
     if tag:
         where.append("tags.name = ?")
-        params.append(tag)
     if tool:
         where.append("tools.name = ?")
-        params.append(tool)
 
-    sql_str = "\n".join(sql)
-    if where:
-        sql_str += "\nWHERE " + " AND ".join(where)
-    sql_str += "\nORDER BY tools.name, commands.name"
+    sql_str = "\n".join(sql) + "\nWHERE " + " AND ".join(where)
+    if scored:
+        return sql_str + "\nORDER BY score DESC, tools.name, commands.name LIMIT ?"
+    return sql_str + "\nORDER BY tools.name, commands.name"
+
+class CatalogItem(NamedTuple):
+    """One fuzzy/pick candidate; a tuple is quicker to build and unpickle than a dict."""
+    tool: str
+    cmd: str
+    desc: str
+    snippet: str
+    summary: str
+    search_norm: str  # normalized "tool cmd desc snippet", what fuzzy scores
+    bigrams: int = 0  # bigram bitmask for large catalogs, see _prefilter
+    score: Optional[float] = None  # set when scored in SQL
+
+def _build_catalog(
+    conn: sqlite3.Connection,
+    tool: Optional[str] = None,
+    tag: Optional[str] = None,
+    query: Optional[str] = None,
+    limit: Optional[int] = None,
+):
+    """
+    Return a list of CatalogItem, in tool/command order.
+
+    With `query` (already default_process'ed), rows are scored in SQL by the
+    `wratio` function the caller registered, and only the best `limit` come back,
+    each with a `score`.
+    """
+    params = []
+    if query:
+        params.append(query)
+    if tag:
+        params.append(tag)
+    if tool:
+        params.append(tool)
+    if query:
+        params.append(limit or -1)
+    sql_str = _catalog_sql(bool(query), bool(tag), bool(tool))
 
     rows = conn.execute(sql_str, params).fetchall()
+    # normalize once here (and in the on-disk cache) rather than per choice per query
+    norm = str
+    if HAS_RF:
+        from rapidfuzz.utils import default_process as norm
+    gate = len(rows) >= FUZZY_PREFILTER_MIN
     items = []
-    for tool_name, cmd_name, desc, snip in rows:
-        if not cmd_name:  # skip tools that have no command row
-            continue
-        summary = desc or (snip[:80] + "…" if snip and len(snip) > 80 else snip)
-        searchable = " ".join(filter(None, [tool_name, cmd_name, desc, snip]))
-        items.append({
-            "tool": tool_name,
-            "cmd": cmd_name,
-            "desc": desc or "",
-            "snippet": snip or "",
-            "summary": summary or "",
-            "search": searchable
-        })
+    # summary and search text come precomputed from SQL (see _catalog_sql)
+    for tool_name, cmd_name, desc, snip, summary, searchable, *score in rows:
+        search_norm = norm(searchable)
+        items.append(CatalogItem(
+            tool_name, cmd_name, desc, snip, summary, search_norm,
+            _bigrams(search_norm) if gate else 0, score[0] if score else None,
+        ))
+    return items
+
+# Catalogs at least this big get a bigram gate in front of WRatio; the gated
+# top-k is kept only if even its last hit scores at least FUZZY_PREFILTER_TRUST
+FUZZY_PREFILTER_MIN = 2000
+FUZZY_PREFILTER_TRUST = 70
+
+_popcount = getattr(int, "bit_count", lambda x: bin(x).count("1"))
+
+def _bigrams(s: str) -> int:
+    # Bigrams hashed into a 1021-bit int: pickles as a few bytes and intersects
+    # with one `&`. Collisions only over-count shared bigrams, so the gate errs
+    # towards keeping items. Deterministic on purpose (str hash() is salted).
+    b = s.encode()
+    mask = 0
+    for x, y in zip(b, b[1:]):
+        mask |= 1 << ((x * 257 + y) % 1021)
+    return mask
+
+def _prefilter(query: str, catalog: List[CatalogItem], top: int) -> Optional[List[int]]:
+    """Indices of items sharing at least a quarter of the query's bigrams.
+
+    None means "score everything": small catalog, or too few survivors to fill `top`.
+    """
+    if len(catalog) < FUZZY_PREFILTER_MIN:
+        return None
+    qb = _bigrams(query)
+    need = max(1, _popcount(qb) // 4)
+    cand = [i for i, it in enumerate(catalog) if _popcount(it.bigrams & qb) >= need]
+    return cand if len(cand) >= top else None
+
+# Bump when the items built by _build_catalog change shape
+_CATALOG_FORMAT = 5
+CATALOG_CACHE = Path(os.environ.get("MYMAN_CATALOG_CACHE", Path.home() / ".myman.catalog"))
+
+def _load_catalog(tool: Optional[str] = None, tag: Optional[str] = None):
+    """_build_catalog, served from an on-disk snapshot for the unfiltered case."""
+    if tool or tag:
+        with db() as conn:
+            return _build_catalog(conn, tool=tool, tag=tag)
+    # Stamp before opening: our own connection touches the files, and an older
+    # stamp can only cause a rebuild, never a stale hit.
+    stamp = (_CATALOG_FORMAT, HAS_RF, _db_stamp())
+    try:
+        with CATALOG_CACHE.open("rb") as f:
+            cached_stamp, items = pickle.load(f)
+        if cached_stamp == stamp:
+            return items
+    except Exception:  # missing, truncated, or pickled by an older/other build: rebuild
+        pass
+    with db() as conn:
+        items = _build_catalog(conn)
+    _write_snapshot(CATALOG_CACHE, (stamp, items))
     return items
 
+def _write_snapshot(path: Path, obj) -> None:
+    # atomic replace so a concurrent reader sees the old file or the new one
+    try:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except OSError:
+        pass  # cache is best effort
+
+@functools.lru_cache(maxsize=1)
+def _wratio_sql():
+    """The `wratio` SQL function: SQL-side twin of _rank's scoring, same text and
+    normalization as search_norm. Imports and lookups are bound once here instead
+    of on every row SQLite feeds it (about half the per-row cost)."""
+    from rapidfuzz.fuzz import WRatio
+    from rapidfuzz.utils import default_process
+    join = " ".join
+
+    def wratio(query: str, *cols: Optional[str]) -> float:
+        return WRatio(query, default_process(join(filter(None, cols))), processor=None)
+    return wratio
+
+def _rank(query: str, choices: List[str], top: int, cutoff: float = 0) -> List[Tuple[int, float]]:
+    """Top `top` (index, score) pairs by WRatio, best first, ties by catalog order.
+
+    `query` and `choices` must already be run through utils.default_process.
+    Choices scoring under `cutoff` may be dropped or reported as 0.
+    """
+    from rapidfuzz import process, fuzz
+    try:
+        import numpy as np
+    except ImportError:  # cdist needs NumPy; extract keeps its own heap
+        return [(idx, score) for _, score, idx in process.extract(query, choices, scorer=fuzz.WRatio, processor=None, limit=top, score_cutoff=cutoff)]
+    # one multi-threaded C scan over every choice instead of a Python-side heap
+    # a cutoff lets WRatio bail out of hopeless pairs early, which is most of them
+    scores = process.cdist([query], choices, scorer=fuzz.WRatio, processor=None, dtype=np.float64, workers=-1, score_cutoff=cutoff)[0]
+    idx = np.arange(len(scores))
+    if len(idx) > top:
+        kth = np.partition(scores, len(idx) - top)[len(idx) - top]
+        idx = np.flatnonzero(scores >= kth)  # O(N) cut, keeping every tie at the boundary
+    idx = idx[np.lexsort((idx, -scores[idx]))][:top]
+    return [(int(i), float(scores[i])) for i in idx]
+
 @app.command("fuzzy")
 def fuzzy(
     query: Optional[str] = typer.Argument(None, help="Search text (optional)"),
     tool: Optional[str] = typer.Option(None, "--tool", "-T", help="Restrict to one tool"),
     tag: Optional[str]  = typer.Option(None, "--tag", "-t", help="Filter by tag"),
     top: int = typer.Option(10, "--top", "-n", help="Number of results to show"),
+    max_dist: Optional[int] = typer.Option(None, "--max-dist", "-d", help="Match command names within N edits instead"),
     choose: bool = typer.Option(False, "--choose", "-c", help="Prompt to choose and act on a result"),
     exec_: bool = typer.Option(False, "--exec", "-x", help="Execute chosen snippet"),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirm when executing"),
@@ -686,32 +1368,69 @@ def fuzzy(
 ):
     """Fuzzy rank tools/commands (RapidFuzz). Use --choose to pick and act."""
     if not HAS_RF:
-        raise typer.Exit("Fuzzy search requires 'rapidfuzz'. Install it with: pip install rapidfuzz")
-
-    with db() as conn:
-        catalog = _build_catalog(conn, tool=tool, tag=tag)
+        _die("Fuzzy search requires 'rapidfuzz'. Install it with: pip install rapidfuzz")
+    from rapidfuzz import process, utils
+    from rapidfuzz.distance import Levenshtein
+
+    ranked = None
+    if query and max_dist is None and (tool or tag):
+        # Filtered catalogs bypass the snapshot anyway: let SQLite score each row
+        # and keep only the top ones instead of materializing them all.
+        with db() as conn:
+            conn.create_function("wratio", 5, _wratio_sql(), deterministic=True)
+            catalog = _build_catalog(conn, tool=tool, tag=tag, query=utils.default_process(query), limit=top)
+        ranked = [(i, it.score) for i, it in enumerate(catalog)]
+    else:
+        catalog = _load_catalog(tool=tool, tag=tag)
     if not catalog:
         console.print("No commands found.")
         raise typer.Exit(0)
 
-    choices = [it["search"] for it in catalog]
-    if query:
-        matches = process.extract(query, choices, scorer=fuzz.WRatio, limit=top)
-        ranked = [(idx, score) for choice, score, idx in matches]
+    choices = [it.search_norm for it in catalog]
+    if ranked is not None:
+        pass
+    elif query and max_dist is not None:
+        # score_cutoff lets RapidFuzz abandon each name once it exceeds max_dist edits
+        names = [utils.default_process(it.cmd) for it in catalog]
+        matches = process.extract(
+            utils.default_process(query), names, scorer=Levenshtein.distance,
+            processor=None, score_cutoff=max_dist, limit=top,
+        )
+        ranked = [(idx, dist) for _, dist, idx in matches]
+        if not ranked:
+            console.print(f"No command names within {max_dist} edit(s).")
+            raise typer.Exit(0)
+    elif query:
+        q = utils.default_process(query)
+        cand = _prefilter(q, catalog, top)
+        if cand is not None:
+            # scores under the trust bar are discarded below anyway, so let WRatio skip them
+            ranked = [(cand[i], score) for i, score in _rank(q, [choices[j] for j in cand], top, FUZZY_PREFILTER_TRUST)]
+            if len(ranked) < top or ranked[-1][1] < FUZZY_PREFILTER_TRUST:
+                ranked = None  # weak matches: gated-out items could outrank these
+        if ranked is None:
+            ranked = _rank(q, choices, top)
     else:
         # No query: just take the first N (alphabetical by tool/cmd due to ORDER BY)
         ranked = [(i, 100) for i in range(min(top, len(catalog)))]
 
-    table = Table(title=f"Fuzzy: {query or '*'}", show_lines=False)
-    table.add_column("#", justify="right")
-    table.add_column("Tool", style="bold")
-    table.add_column("Command")
-    table.add_column("Score", justify="right")
-    table.add_column("Summary")
-    for k, (idx, score) in enumerate(ranked, start=1):
-        it = catalog[idx]
-        table.add_row(str(k), it["tool"], it["cmd"], str(int(score)), it["summary"])
-    console.print(table)
+    out = [
+        (str(k), catalog[idx].tool, catalog[idx].cmd, str(int(score)), catalog[idx].summary)
+        for k, (idx, score) in enumerate(ranked, start=1)
+    ]
+    if _plain(out):
+        _write_tsv(out)
+    else:
+        from rich.table import Table
+        table = Table(title=f"Fuzzy: {query or '*'}", show_lines=False)
+        table.add_column("#", justify="right")
+        table.add_column("Tool", style="bold")
+        table.add_column("Command")
+        table.add_column("Edits" if query and max_dist is not None else "Score", justify="right")
+        table.add_column("Summary")
+        for row in out:
+            table.add_row(*row)
+        console.print(table)
 
     if not choose:
         raise typer.Exit(0)
@@ -719,27 +1438,28 @@ def fuzzy(
     # choose & act
     pick = typer.prompt("Pick #", type=int)
     if pick < 1 or pick > len(ranked):
-        raise typer.Exit("Invalid selection.")
+        _die("Invalid selection.")
     chosen = catalog[ranked[pick - 1][0]]
+    data = chosen.snippet.encode("utf-8")
 
     # optional clipboard
     if copy:
-        try:
-            subprocess.run(["pbcopy"], input=(chosen["snippet"]).encode(), check=True)
+        if _copy_clipboard(chosen.snippet, data):
             console.print("[dim]Snippet copied to clipboard.[/]")
-        except Exception:
+        else:
             console.print("[dim]Clipboard copy failed (pbcopy not available).[/]")
 
     if exec_:
-        if not yes and not typer.confirm(f"Run {chosen['tool']} · {chosen['cmd']} ?", default=False):
+        if not yes and not _confirm(f"Run {chosen.tool} · {chosen.cmd} ?"):
             raise typer.Exit(1)
-        try:
-            subprocess.run([shell, "-lc", chosen["snippet"]], check=True)
-        except subprocess.CalledProcessError as e:
-            raise typer.Exit(e.returncode)
+        _exec_shell(shell, chosen.snippet)
     else:
         # default: print raw snippet (so zsh widget or user can edit placeholders easily)
-        sys.stdout.write(chosen["snippet"] + ("\n" if not chosen["snippet"].endswith("\n") else ""))
+        _emit_snippet(data)
+
+def _printf_b_escape(s: str) -> str:
+    # one physical line for fzf; printf %b restores it (every literal backslash is doubled)
+    return s.replace("\\", "\\\\").replace("\t", "\\t").replace("\r", "\\r").replace("\n", "\\n")
 
 @app.command("pick")
 def pick(
@@ -752,26 +1472,33 @@ def pick(
     shell: str = typer.Option("/bin/zsh", "--shell", help="Shell to execute under with --exec"),
 ):
     """Interactive picker using fzf (if installed). Prints snippet by default."""
-    if shutil.which("fzf") is None:
-        raise typer.Exit("fzf not found. Install with: brew install fzf  (or use: vman fuzzy --choose)")
+    fzf = _which("fzf")
+    if fzf is None:
+        _die("fzf not found. Install with: brew install fzf  (or use: vman fuzzy --choose)")
 
-    with db() as conn:
-        catalog = _build_catalog(conn, tool=tool, tag=tag)
+    catalog = _load_catalog(tool=tool, tag=tag)
     if not catalog:
         console.print("No commands found.")
         raise typer.Exit(0)
 
-    # Each line: TOOL \t CMD \t SUMMARY
-    lines = [f"{it['tool']}\t{it['cmd']}\t{it['summary']}" for it in catalog]
+    # Each line: TOOL \t CMD \t SUMMARY \t PREVIEW (hidden; printf %b decodes it)
+    lines = [
+        f"{it.tool}\t{it.cmd}\t{it.summary}\t"
+        + _printf_b_escape(f"# {it.tool} · {it.cmd}\n# {it.desc}\n{it.snippet}")
+        for it in catalog
+    ]
+    preview = "printf '%b\\n' {4}"
+    if _which("bat"):
+        preview += " | bat -l bash -p --color=always"
 
     fzf_cmd = [
-        "fzf",
+        fzf,  # resolved path: the spawn does not search PATH again
         "--ansi",
         "--delimiter", "\t",
         "--with-nth", "1,2,3",
         "--nth", "1,2,3",
         "--bind", "alt-y:execute-silent(echo {1}\t{2} | pbcopy)+abort",
-        "--preview", "vman run {1} {2} --preview --no-raw",
+        "--preview", preview,
         "--prompt", "vman> ",
     ]
     if query:
@@ -785,30 +1512,23 @@ def pick(
         raise typer.Exit(1)
 
     tool_name, cmd_name, _ = out[-1].split("\t", 2)
-
-    # look up snippet
-    with db() as conn:
-        tid = get_tool_id(conn, tool_name)
-        row = conn.execute("SELECT snippet FROM commands WHERE tool_id=? AND name=?", (tid, cmd_name)).fetchone()
-    snippet = (row[0] if row else "").strip()
+    chosen = next((it for it in catalog if it.tool == tool_name and it.cmd == cmd_name), None)
+    snippet = (chosen.snippet if chosen else "").strip()
+    data = snippet.encode("utf-8")
 
     if copy:
-        try:
-            subprocess.run(["pbcopy"], input=snippet.encode(), check=True)
+        if _copy_clipboard(snippet, data):
             console.print("[dim]Snippet copied to clipboard.[/]")
-        except Exception:
+        else:
             console.print("[dim]Clipboard copy failed (pbcopy not available).[/]")
 
     if exec_:
-        if not yes and not typer.confirm(f"Run {tool_name} · {cmd_name} ?", default=False):
+        if not yes and not _confirm(f"Run {tool_name} · {cmd_name} ?"):
             raise typer.Exit(1)
-        try:
-            subprocess.run([shell, "-lc", snippet], check=True)
-        except subprocess.CalledProcessError as e:
-            raise typer.Exit(e.returncode)
+        _exec_shell(shell, snippet)
     else:
         # default: print raw snippet
-        sys.stdout.write(snippet + ("\n" if not snippet.endswith("\n") else ""))
+        _emit_snippet(data)
 
 # ------------------------------------------------------------
 # TUI Based Editing
@@ -816,411 +1536,482 @@ def pick(
 
 # ------------------------------ TUI helpers ------------------------------
 
+# Re-run on every tool switch/reload; one constant text each, so the connection's
+# statement cache hands back the prepared statement instead of re-parsing
+_FETCH_TOOLS_SQL = "SELECT id, name, COALESCE(description,'') FROM tools ORDER BY name"
+_FETCH_CMDS_SQL = (
+    "SELECT name, COALESCE(description,''), COALESCE(snippet,'') "
+    "FROM commands WHERE tool_id=? ORDER BY name"
+)
+
+def _row_label(name: str, desc: str) -> str:
+    # list entry text for a tool or command; no dangling dash when there is no description
+    return f"{name}  —  {desc}" if desc else name
+
 def _db_fetch_tools(conn) -> List[Tuple[int, str, str]]:
-    return conn.execute("SELECT id,name,COALESCE(description,'') FROM tools ORDER BY name").fetchall()
+    return conn.execute(_FETCH_TOOLS_SQL).fetchall()
 
 def _db_fetch_cmds(conn, tool_id: int) -> List[Tuple[str, str, str]]:
-    return conn.execute(
-        "SELECT name, COALESCE(description,''), COALESCE(snippet,'') "
-        "FROM commands WHERE tool_id=? ORDER BY name",
-        (tool_id,)
-    ).fetchall()
+    return conn.execute(_FETCH_CMDS_SQL, (tool_id,)).fetchall()
 
 def _db_upsert_tool(conn, name: str, description: str, tags: List[str]) -> int:
-    # upsert tool
-    row = conn.execute("SELECT id FROM tools WHERE name=?", (name,)).fetchone()
-    if row:
-        tool_id = row[0]
-        conn.execute("UPDATE tools SET description=? WHERE id=?", (description, tool_id))
-    else:
-        cur = conn.execute("INSERT INTO tools(name,description) VALUES(?,?)", (name, description))
-        tool_id = cur.lastrowid
-    # tags
-    for tag in [t.strip() for t in tags if t.strip()]:
-        row = conn.execute("SELECT id FROM tags WHERE name=?", (tag,)).fetchone()
-        if row:
-            tag_id = row[0]
-        else:
-            tag_id = conn.execute("INSERT INTO tags(name) VALUES(?)", (tag,)).lastrowid
-        conn.execute("INSERT OR IGNORE INTO tool_tags(tool_id, tag_id) VALUES(?,?)", (tool_id, tag_id))
+    # the form always owns the description, so unlike ensure_tool an empty one does overwrite
+    tool_id = conn.execute(
+        "INSERT INTO tools(name, description) VALUES(?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET description=excluded.description RETURNING id",
+        (name, description),
+    ).fetchone()[0]
+    _TOOL_IDS[name] = tool_id
+    attach_tags(conn, tool_id, tags)
     return tool_id
 
 def _db_upsert_cmd(conn, tool_id: int, name: str, description: str, snippet: str) -> None:
-    row = conn.execute("SELECT 1 FROM commands WHERE tool_id=? AND name=?", (tool_id, name)).fetchone()
-    if row:
-        conn.execute(
-            "UPDATE commands SET description=?, snippet=? WHERE tool_id=? AND name=?",
-            (description, snippet, tool_id, name),
-        )
-    else:
-        conn.execute(
-            "INSERT INTO commands(tool_id, name, description, snippet) VALUES(?,?,?,?)",
-            (tool_id, name, description, snippet),
-        )
+    conn.execute(UPSERT_COMMAND_SQL, (tool_id, name, description, snippet))
 
 def _db_delete_cmd(conn, tool_id: int, name: str) -> None:
     conn.execute("DELETE FROM commands WHERE tool_id=? AND name=?", (tool_id, name))
 
-def _copy_clipboard(text: str) -> bool:
-    try:
-        if shutil.which("pbcopy"):
-            subprocess.run(["pbcopy"], input=text.encode(), check=True)
-            return True
-    except Exception:
-        pass
-    return False
-
-# ------------------------------ TUI modals ------------------------------
+@functools.lru_cache(maxsize=1)
+def _tui_app():
+    """Import Textual and build the TUI classes on first use, so no other command pays for it."""
+    from textual.app import App, ComposeResult
+    from textual.widgets import Header, Footer, Input, Static, ListView, ListItem, Label, Button
+    from textual.containers import Horizontal, Vertical
+    from textual.screen import ModalScreen
+    from textual.timer import Timer
 
-class Confirm(ModalScreen[bool]):
-    def __init__(self, message: str):
-        super().__init__()
-        self.message = message
+    # ------------------------------ TUI modals ------------------------------
 
-    def compose(self) -> ComposeResult:
-        yield Static(self.message, id="confirm-msg")
-        yield Horizontal(
-            Button("Yes", id="yes", variant="success"),
-            Button("No", id="no", variant="error"),
-            id="confirm-buttons"
-        )
+    class Confirm(ModalScreen[bool]):
+        def __init__(self, message: str):
+            super().__init__()
+            self.message = message
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        self.dismiss(event.button.id == "yes")
-
-
-class CmdForm(ModalScreen[Dict[str, str]]):
-    """Modal to add/edit a command."""
-    def __init__(self, title: str, name: str = "", desc: str = "", snippet: str = ""):
-        super().__init__()
-        self.title = title
-        self._name = name
-        self._desc = desc
-        self._snippet = snippet
-
-    def compose(self) -> ComposeResult:
-        yield Static(f"[b]{self.title}[/b]")
-        yield Label("Command name:")
-        self.name_in = Input(self._name, placeholder="e.g., compose-up")
-        yield self.name_in
-        yield Label("Description:")
-        self.desc_in = Input(self._desc, placeholder="What this does…")
-        yield self.desc_in
-        yield Label("Snippet:")
-        self.snip_in = Input(self._snippet, placeholder="Exact CLI with <placeholders>")
-        yield self.snip_in
-        yield Horizontal(Button("Save", id="save", variant="success"),
-                         Button("Cancel", id="cancel", variant="error"))
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "save":
-            data = {
-                "name": self.name_in.value.strip(),
-                "desc": self.desc_in.value.strip(),
-                "snippet": self.snip_in.value.rstrip(),
-            }
-            self.dismiss(data)
-        else:
-            self.dismiss({})
-
-class ToolForm(ModalScreen[Dict[str, str]]):
-    def compose(self) -> ComposeResult:
-        yield Static("[b]Add / Update Tool[/b]")
-        yield Label("Tool name:")
-        self.name_in = Input(placeholder="e.g., docker")
-        yield self.name_in
-        yield Label("Description:")
-        self.desc_in = Input(placeholder="Short description")
-        yield self.desc_in
-        yield Label("Tags (comma-separated):")
-        self.tags_in = Input(placeholder="dev,ops,containers")
-        yield self.tags_in
-        yield Horizontal(Button("Save", id="save", variant="success"),
-                         Button("Cancel", id="cancel", variant="error"))
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id == "save":
-            self.dismiss({
-                "name": self.name_in.value.strip(),
-                "desc": self.desc_in.value.strip(),
-                "tags": self.tags_in.value,
-            })
-        else:
-            self.dismiss({})
-
-# ------------------------------ Main TUI app ------------------------------
-
-class VmanTUI(App):
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-    #topbar {
-        height: 3;
-    }
-    #main {
-        height: 1fr;
-    }
-    #left, #right {
-        height: 1fr;
-    }
-    #left {
-        width: 30%;
-        border: round $panel;
-    }
-    #right {
-        width: 70%;
-        border: round $panel;
-    }
-    #preview {
-        height: 8;
-        border: round $secondary;
-        padding: 1;
-    }
-    #helpbar {
-        color: $text 50%;
-    }
-    """
+        def compose(self) -> ComposeResult:
+            yield Static(self.message, id="confirm-msg")
+            yield Horizontal(
+                Button("Yes", id="yes", variant="success"),
+                Button("No", id="no", variant="error"),
+                id="confirm-buttons"
+            )
 
-    BINDINGS = [
-        ("q", "quit", "Quit"),
-        ("a", "add_cmd", "Add cmd"),
-        ("e", "edit_cmd", "Edit cmd"),
-        ("backspace", "delete_cmd", "Delete cmd"),
-        ("t", "add_tool", "Add tool"),
-        ("/", "focus_search", "Search"),
-        ("y", "copy_snippet", "Copy"),
-        ("p", "print_snippet", "Print"),
-        ("x", "exec_snippet", "Exec"),
-        ("r", "reload", "Reload"),
-    ]
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            self.dismiss(event.button.id == "yes")
+
+
+    class CmdForm(ModalScreen[Dict[str, str]]):
+        """Modal to add/edit a command."""
+        def __init__(self, title: str, name: str = "", desc: str = "", snippet: str = ""):
+            super().__init__()
+            self.title = title
+            self._name = name
+            self._desc = desc
+            self._snippet = snippet
+
+        def compose(self) -> ComposeResult:
+            yield Static(f"[b]{self.title}[/b]")
+            yield Label("Command name:")
+            self.name_in = Input(self._name, placeholder="e.g., compose-up")
+            yield self.name_in
+            yield Label("Description:")
+            self.desc_in = Input(self._desc, placeholder="What this does…")
+            yield self.desc_in
+            yield Label("Snippet:")
+            self.snip_in = Input(self._snippet, placeholder="Exact CLI with <placeholders>")
+            yield self.snip_in
+            yield Horizontal(Button("Save", id="save", variant="success"),
+                             Button("Cancel", id="cancel", variant="error"))
+
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            if event.button.id == "save":
+                data = {
+                    "name": self.name_in.value.strip(),
+                    "desc": self.desc_in.value.strip(),
+                    "snippet": self.snip_in.value.rstrip(),
+                }
+                self.dismiss(data)
+            else:
+                self.dismiss({})
+
+    class ToolForm(ModalScreen[Dict[str, str]]):
+        def compose(self) -> ComposeResult:
+            yield Static("[b]Add / Update Tool[/b]")
+            yield Label("Tool name:")
+            self.name_in = Input(placeholder="e.g., docker")
+            yield self.name_in
+            yield Label("Description:")
+            self.desc_in = Input(placeholder="Short description")
+            yield self.desc_in
+            yield Label("Tags (comma-separated):")
+            self.tags_in = Input(placeholder="dev,ops,containers")
+            yield self.tags_in
+            yield Horizontal(Button("Save", id="save", variant="success"),
+                             Button("Cancel", id="cancel", variant="error"))
+
+        def on_button_pressed(self, event: Button.Pressed) -> None:
+            if event.button.id == "save":
+                self.dismiss({
+                    "name": self.name_in.value.strip(),
+                    "desc": self.desc_in.value.strip(),
+                    "tags": self.tags_in.value,
+                })
+            else:
+                self.dismiss({})
+
+    # ------------------------------ Main TUI app ------------------------------
+
+    class VmanTUI(App[Optional[str]]):
+        CSS = """
+        Screen {
+            layout: vertical;
+        }
+        #topbar {
+            height: 3;
+        }
+        #main {
+            height: 1fr;
+        }
+        #left, #right {
+            height: 1fr;
+        }
+        #left {
+            width: 30%;
+            border: round $panel;
+        }
+        #right {
+            width: 70%;
+            border: round $panel;
+        }
+        #preview {
+            height: 8;
+            border: round $secondary;
+            padding: 1;
+        }
+        #helpbar {
+            color: $text 50%;
+        }
+        """
+
+        BINDINGS = [
+            ("q", "quit", "Quit"),
+            ("a", "add_cmd", "Add cmd"),
+            ("e", "edit_cmd", "Edit cmd"),
+            ("backspace", "delete_cmd", "Delete cmd"),
+            ("t", "add_tool", "Add tool"),
+            ("/", "focus_search", "Search"),
+            ("y", "copy_snippet", "Copy"),
+            ("p", "print_snippet", "Print"),
+            ("x", "exec_snippet", "Exec"),
+            ("r", "reload", "Reload"),
+        ]
 
-    search_text = reactive("")
-    selected_tool: Optional[Tuple[int, str]] = None
-    selected_cmd: Optional[Tuple[str, str, str]] = None  # (name, desc, snippet)
-    tool_rows: List[Tuple[int, str, str]] = []
-    cmd_rows: List[Tuple[str, str, str]] = []
-
-    def compose(self) -> ComposeResult:
-        yield Header(show_clock=True)
-        with Horizontal(id="topbar"):
-            yield Label("Search:", id="search-label")
-            self.search = Input(placeholder="Type to filter commands…")
-            yield self.search
-            yield Static("[b]Keys[/b]: a add • e edit • ⌫ del • y copy • p print • x exec • / search • q quit", id="helpbar")
-        with Horizontal(id="main"):
-            with Vertical(id="left"):
-                yield Static("[b]Tools[/b]")
-                self.tools = ListView()
-                yield self.tools
-            with Vertical(id="right"):
-                yield Static("[b]Commands[/b]")
-                self.cmds = ListView()
-                yield self.cmds
-                yield Static("[b]Preview[/b]")
-                self.preview = Static("", id="preview")
-                yield self.preview
-        yield Footer()
-
-    # Lifecycle
-    def on_mount(self) -> None:
-        self.load_tools()
-
-    # Data loading
-    def load_tools(self) -> None:
-        with db() as conn:
-            self.tool_rows = _db_fetch_tools(conn)
-        self.tools.clear()
-        for _id, name, desc in self.tool_rows:
-            self.tools.append(ListItem(Label(f"{name}  —  {desc}")))
-        if self.tool_rows:
-            self.tools.index = 0
-            self._set_selected_tool(0)
-
-    def load_cmds(self) -> None:
-        self.cmds.clear()
-        self.preview.update("")
-        if not self.selected_tool:
-            return
-        tool_id, _ = self.selected_tool
-        with db() as conn:
-            self.cmd_rows = _db_fetch_cmds(conn, tool_id)
-        rows = self._filtered_cmds()
-        for name, desc, _ in rows:
-            self.cmds.append(ListItem(Label(f"{name}  —  {desc}")))
-        if rows:
-            self.cmds.index = 0
-            self._set_selected_cmd(0)
-
-    def _filtered_cmds(self) -> List[Tuple[str, str, str]]:
-        q = self.search.value.strip().lower()
-        if not q:
-            return self.cmd_rows
-        out = []
-        for name, desc, snip in self.cmd_rows:
-            blob = " ".join([name, desc, snip]).lower()
-            if all(part in blob for part in q.split()):
-                out.append((name, desc, snip))
-        return out
-
-    # Selection helpers
-    def _set_selected_tool(self, idx: int) -> None:
-        if 0 <= idx < len(self.tool_rows):
-            tool_id, name, _ = self.tool_rows[idx]
-            self.selected_tool = (tool_id, name)
-            self.load_cmds()
-
-    def _set_selected_cmd(self, idx: int) -> None:
-        rows = self._filtered_cmds()
-        if 0 <= idx < len(rows):
-            self.selected_cmd = rows[idx]
-            name, desc, snippet = self.selected_cmd
-            self.preview.update(f"[b]{name}[/b]\n{desc}\n\n[dim]{snippet}[/dim]")
+        FILTER_DELAY = 0.12  # seconds of typing pause before the command list is refiltered
+        PREVIEW_DELAY = 0.05  # seconds the cursor must rest on a command before its preview renders
+
+        def __init__(self) -> None:
+            super().__init__()
+            # plain per-instance state: nothing here needs reactive watchers
+            self.selected_tool: Optional[Tuple[int, str]] = None
+            self.selected_cmd: Optional[Tuple[str, str, str]] = None  # (name, desc, snippet)
+            self.tool_rows: List[Tuple[int, str, str]] = []
+            self.cmd_rows: List[Tuple[str, str, str]] = []
+            self.cmd_blobs: List[str] = []  # lowercased "name desc snippet" per cmd_rows entry
+            self.cmd_labels: Dict[Tuple[str, str, str], str] = {}  # list label per cmd_rows entry
+            self.shown_cmds: List[Tuple[str, str, str]] = []  # cmd_rows under the current filter, as listed
+            self.cmd_items: List[ListItem] = []  # the ListItem showing each shown_cmds row
+            self._filter_timer: Optional[Timer] = None
+            self._cmds_generation = 0  # bumped by each rebuild/refilter of the command list
+            self._preview_timer: Optional[Timer] = None
+            self._preview_shown: Optional[Tuple[str, str, str]] = None  # row the preview panel shows
+
+        def compose(self) -> ComposeResult:
+            yield Header(show_clock=True)
+            with Horizontal(id="topbar"):
+                yield Label("Search:", id="search-label")
+                self.search = Input(placeholder="Type to filter commands…")
+                yield self.search
+                yield Static("[b]Keys[/b]: a add • e edit • ⌫ del • y copy • p print • x exec • / search • q quit", id="helpbar")
+            with Horizontal(id="main"):
+                with Vertical(id="left"):
+                    yield Static("[b]Tools[/b]")
+                    self.tools = ListView()
+                    yield self.tools
+                with Vertical(id="right"):
+                    yield Static("[b]Commands[/b]")
+                    self.cmds = ListView()
+                    yield self.cmds
+                    yield Static("[b]Preview[/b]")
+                    self.preview = Static("", id="preview")
+                    yield self.preview
+            yield Footer()
+
+        # Lifecycle
+        def on_mount(self) -> None:
+            self.load_tools()
 
-    def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
-        """Update selection when a list view item is highlighted."""
-        # Textual >= 0.60: event.index was removed; use the list's current index
-        idx = getattr(event.list_view, "index", None)
-        if idx is None:
-            return
-        if event.list_view is self.tools:
-            self._set_selected_tool(idx)
-        elif event.list_view is self.cmds:
-            self._set_selected_cmd(idx)
-
-    def on_input_changed(self, event: Input.Changed) -> None:
-        if event.input is self.search:
-            # refresh cmds list under current filter
+        # Data loading
+        def load_tools(self) -> None:
+            with db() as conn:
+                self.tool_rows = _db_fetch_tools(conn)
+            self.tools.clear()
+            # one mount (and layout pass) for the whole list, not one per append
+            self.tools.extend(ListItem(Label(_row_label(name, desc))) for _id, name, desc in self.tool_rows)
+            if self.tool_rows:
+                self.tools.index = 0
+                self._set_selected_tool(0)
+
+        def load_cmds(self) -> None:
+            if not self.selected_tool:
+                self.cmds.clear()
+                self.selected_cmd = None
+                self._render_preview()
+                return
+            tool_id, _ = self.selected_tool
+            with db() as conn:
+                self.cmd_rows = _db_fetch_cmds(conn, tool_id)
+            # lowercased/formatted once per load, not per row on every refilter
+            self.cmd_blobs = [" ".join(row).lower() for row in self.cmd_rows]
+            self.cmd_labels = {row: _row_label(row[0], row[1]) for row in self.cmd_rows}
+            self._show_cmds()
+
+        def _show_cmds(self) -> None:
+            """Filter cmd_rows once and rebuild the command list from the result."""
+            if self._filter_timer is not None:  # this refresh covers any pending one
+                self._filter_timer.stop()
+                self._filter_timer = None
+            self._cmds_generation += 1  # any refilter still awaiting its DOM changes stands down
+            self.shown_cmds = rows = self._filtered_cmds()
+            self.cmd_items = [ListItem(Label(self.cmd_labels[row])) for row in rows]
             self.cmds.clear()
-            for name, desc, _ in self._filtered_cmds():
-                self.cmds.append(ListItem(Label(f"{name}  —  {desc}")))
-            if self._filtered_cmds():
+            self.cmds.extend(self.cmd_items)
+            self._select_first_cmd()
+
+        async def _refilter_cmds(self) -> None:
+            """Apply a new search filter to the listed commands of the same tool.
+
+            Both the old and the new list are subsequences of cmd_rows, so rows that
+            stay keep their widgets; only rows leaving or entering are unmounted/mounted.
+            """
+            self._filter_timer = None
+            rows = self._filtered_cmds()
+            if rows == self.shown_cmds:
+                return
+            self._cmds_generation += 1
+            generation = self._cmds_generation
+            old = dict(zip(self.shown_cmds, self.cmd_items))
+            keep = set(rows)
+            gone = [item for row, item in old.items() if row not in keep]
+            # Queue every DOM change and record the new state before the first await:
+            # a refilter or _show_cmds that runs meanwhile diffs against (or clears)
+            # this list, and new runs are anchored on kept items, never on removed ones.
+            pending = [self.cmds.remove_children(gone)] if gone else []
+            items: List[ListItem] = []
+            new: List[ListItem] = []  # run of new items waiting for the next kept one
+            for row in rows:
+                item = old.get(row)
+                if item is None:
+                    item = ListItem(Label(self.cmd_labels[row]))
+                    new.append(item)
+                elif new:
+                    pending.append(self.cmds.mount(*new, before=item))
+                    new = []
+                items.append(item)
+            if new:
+                pending.append(self.cmds.mount(*new))
+            self.shown_cmds, self.cmd_items = rows, items
+            for step in pending:
+                await step
+            if generation == self._cmds_generation:  # else a newer refresh owns the selection
+                self._select_first_cmd()
+
+        def _select_first_cmd(self) -> None:
+            if self.shown_cmds:
                 self.cmds.index = 0
                 self._set_selected_cmd(0)
             else:
-                self.preview.update("")
                 self.selected_cmd = None
+                self._render_preview()
+
+        def _filtered_cmds(self) -> List[Tuple[str, str, str]]:
+            parts = self.search.value.lower().split()
+            if not parts:
+                return self.cmd_rows
+            pairs = zip(self.cmd_rows, self.cmd_blobs)
+            if len(parts) == 1:
+                part = parts[0]
+                return [row for row, blob in pairs if part in blob]
+            # every term, anywhere: one anchored lookahead per term, so each row is a
+            # single C-level match instead of a Python loop over the terms
+            match = re.compile("".join(f"(?=.*{re.escape(p)})" for p in parts), re.DOTALL).match
+            return [row for row, blob in pairs if match(blob)]
+
+        # Selection helpers
+        def _set_selected_tool(self, idx: int) -> None:
+            if 0 <= idx < len(self.tool_rows):
+                tool_id, name, _ = self.tool_rows[idx]
+                self.selected_tool = (tool_id, name)
+                self.load_cmds()
+
+        def _set_selected_cmd(self, idx: int) -> None:
+            rows = self.shown_cmds
+            if 0 <= idx < len(rows):
+                # actions read selected_cmd right away; the preview waits until the
+                # cursor settles, so holding an arrow key doesn't render every row
+                self.selected_cmd = rows[idx]
+                if self._preview_timer is not None:
+                    self._preview_timer.stop()
+                    self._preview_timer = None
+                if self.selected_cmd != self._preview_shown:
+                    self._preview_timer = self.set_timer(self.PREVIEW_DELAY, self._render_preview)
+
+        def _render_preview(self) -> None:
+            """Show selected_cmd in the preview panel, unless it already shows it."""
+            self._preview_timer = None
+            if self.selected_cmd == self._preview_shown:
+                return
+            self._preview_shown = self.selected_cmd
+            if self.selected_cmd is None:
+                self.preview.update("")
+                return
+            name, desc, snippet = self.selected_cmd
+            self.preview.update(f"[b]{name}[/b]\n{desc}\n\n[dim]{snippet}[/dim]")
 
-    # Actions
-    def action_quit(self) -> None:
-        self.exit()
-
-    def action_focus_search(self) -> None:
-        self.set_focus(self.search)
-
-    def action_reload(self) -> None:
-        self.load_tools()
-
-    def action_add_tool(self) -> None:
-        """Open modal to add/update a tool (runs in a worker)."""
-        async def worker():
-            data = await self.push_screen_wait(ToolForm())
-            if not data or not data.get("name"):
+        def on_list_view_highlighted(self, event: ListView.Highlighted) -> None:
+            """Update selection when a list view item is highlighted."""
+            # Textual >= 0.60: event.index was removed; use the list's current index
+            idx = getattr(event.list_view, "index", None)
+            if idx is None:
                 return
-            name = data["name"]
-            desc = data.get("desc", "")
-            tags = [t.strip() for t in data.get("tags", "").split(",") if t.strip()]
-            with db() as conn:
-                tool_id = _db_upsert_tool(conn, name, desc, tags)
-            # refresh and focus the new/updated tool
+            if event.list_view is self.tools:
+                self._set_selected_tool(idx)
+            elif event.list_view is self.cmds:
+                self._set_selected_cmd(idx)
+
+        def on_input_changed(self, event: Input.Changed) -> None:
+            if event.input is self.search:
+                # refilter once the user pauses, not on every keystroke of a burst
+                if self._filter_timer is not None:
+                    self._filter_timer.stop()
+                self._filter_timer = self.set_timer(self.FILTER_DELAY, self._refilter_cmds)
+
+        # Actions
+        def action_quit(self) -> None:
+            self.exit()
+
+        def action_focus_search(self) -> None:
+            self.set_focus(self.search)
+
+        def action_reload(self) -> None:
             self.load_tools()
-            for i, (tid, nm, _d) in enumerate(self.tool_rows):
-                if tid == tool_id:
-                    self.tools.index = i
-                    self._set_selected_tool(i)
-                    break
-        self.run_worker(worker(), exclusive=True)
-
-    def action_add_cmd(self) -> None:
-        """Open modal to add a command to the selected tool."""
-        if not self.selected_tool:
-            return
-        tool_id, _ = self.selected_tool
-
-        async def worker():
-            data = await self.push_screen_wait(CmdForm("Add Command"))
-            if not data or not data.get("name"):
+
+        def action_add_tool(self) -> None:
+            """Open modal to add/update a tool (runs in a worker)."""
+            async def worker():
+                data = await self.push_screen_wait(ToolForm())
+                if not data or not data.get("name"):
+                    return
+                name = data["name"]
+                desc = data.get("desc", "")
+                tags = [t.strip() for t in data.get("tags", "").split(",") if t.strip()]
+                with db() as conn:
+                    tool_id = _db_upsert_tool(conn, name, desc, tags)
+                # refresh and focus the new/updated tool
+                self.load_tools()
+                for i, (tid, nm, _d) in enumerate(self.tool_rows):
+                    if tid == tool_id:
+                        self.tools.index = i
+                        self._set_selected_tool(i)
+                        break
+            self.run_worker(worker(), exclusive=True)
+
+        def action_add_cmd(self) -> None:
+            """Open modal to add a command to the selected tool."""
+            if not self.selected_tool:
                 return
-            _db_name  = data["name"]
-            _db_desc  = data.get("desc", "")
-            _db_snip  = data.get("snippet", "")
-            with db() as conn:
-                _db_upsert_cmd(conn, tool_id, _db_name, _db_desc, _db_snip)
-            self.load_cmds()
-        self.run_worker(worker(), exclusive=True)
-
-    def action_edit_cmd(self) -> None:
-        """Open modal to edit the currently selected command."""
-        if not (self.selected_tool and self.selected_cmd):
-            return
-        tool_id, _ = self.selected_tool
-        name, desc, snip = self.selected_cmd
-
-        async def worker():
-            data = await self.push_screen_wait(CmdForm("Edit Command", name, desc, snip))
-            if not data or not data.get("name"):
+            tool_id, _ = self.selected_tool
+
+            async def worker():
+                data = await self.push_screen_wait(CmdForm("Add Command"))
+                if not data or not data.get("name"):
+                    return
+                _db_name  = data["name"]
+                _db_desc  = data.get("desc", "")
+                _db_snip  = data.get("snippet", "")
+                with db() as conn:
+                    _db_upsert_cmd(conn, tool_id, _db_name, _db_desc, _db_snip)
+                self.load_cmds()
+            self.run_worker(worker(), exclusive=True)
+
+        def action_edit_cmd(self) -> None:
+            """Open modal to edit the currently selected command."""
+            if not (self.selected_tool and self.selected_cmd):
                 return
-            new_name = data["name"]
-            new_desc = data.get("desc", "")
-            new_snip = data.get("snippet", "")
-            with db() as conn:
-                _db_upsert_cmd(conn, tool_id, new_name, new_desc, new_snip)
-            self.load_cmds()
-        self.run_worker(worker(), exclusive=True)
-
-    def action_delete_cmd(self) -> None:
-        """Confirm + delete the selected command."""
-        if not (self.selected_tool and self.selected_cmd):
-            return
-        tool_id, _ = self.selected_tool
-        name, _, _ = self.selected_cmd
-
-        async def worker():
-            ok = await self.push_screen_wait(Confirm(f"Delete command '{name}'?"))
-            if not ok:
+            tool_id, _ = self.selected_tool
+            name, desc, snip = self.selected_cmd
+
+            async def worker():
+                data = await self.push_screen_wait(CmdForm("Edit Command", name, desc, snip))
+                if not data or not data.get("name"):
+                    return
+                new_name = data["name"]
+                new_desc = data.get("desc", "")
+                new_snip = data.get("snippet", "")
+                with db() as conn:
+                    _db_upsert_cmd(conn, tool_id, new_name, new_desc, new_snip)
+                self.load_cmds()
+            self.run_worker(worker(), exclusive=True)
+
+        def action_delete_cmd(self) -> None:
+            """Confirm + delete the selected command."""
+            if not (self.selected_tool and self.selected_cmd):
                 return
-            with db() as conn:
-                _db_delete_cmd(conn, tool_id, name)
-            self.load_cmds()
-        self.run_worker(worker(), exclusive=True)
-
-    def _current_snippet(self) -> Optional[str]:
-        return (self.selected_cmd[2] if self.selected_cmd else None)
-
-    def action_copy_snippet(self) -> None:
-        snip = self._current_snippet()
-        if not snip:
-            return
-        if _copy_clipboard(snip):
-            self.status = "Copied snippet to clipboard."
-        else:
-            self.status = "Copy failed (no pbcopy)."
-
-    def action_print_snippet(self) -> None:
-        snip = self._current_snippet()
-        if not snip:
-            return
-        # print to STDOUT and exit so caller can capture
-        print(snip, end="" if snip.endswith("\n") else "\n")
-        self.exit()
-
-    def action_exec_snippet(self) -> None:
-        """Confirm + execute the selected snippet."""
-        snip = self._current_snippet()
-        if not snip:
-            return
-
-        async def worker():
-            ok = await self.push_screen_wait(Confirm("Execute snippet now?"))
-            if not ok:
+            tool_id, _ = self.selected_tool
+            name, _, _ = self.selected_cmd
+
+            async def worker():
+                ok = await self.push_screen_wait(Confirm(f"Delete command '{name}'?"))
+                if not ok:
+                    return
+                with db() as conn:
+                    _db_delete_cmd(conn, tool_id, name)
+                self.load_cmds()
+            self.run_worker(worker(), exclusive=True)
+
+        def _current_snippet(self) -> Optional[str]:
+            return (self.selected_cmd[2] if self.selected_cmd else None)
+
+        def action_copy_snippet(self) -> None:
+            snip = self._current_snippet()
+            if not snip:
                 return
-            try:
-                subprocess.run(["/bin/zsh", "-lc", snip], check=True)
-                # optional: show a little status somewhere if you like
-            except subprocess.CalledProcessError as e:
-                # optional: surface e.returncode in the UI
-                pass
-        self.run_worker(worker(), exclusive=True)
+            if _copy_clipboard(snip):
+                self.status = "Copied snippet to clipboard."
+            else:
+                self.status = "Copy failed (no pbcopy)."
+
+        def action_print_snippet(self) -> None:
+            snip = self._current_snippet()
+            if not snip:
+                return
+            # handed back through run() and written by `tui` once the terminal is
+            # restored, so $(vman tui) captures it instead of Textual's print capture
+            self.exit(snip)
+
+        def action_exec_snippet(self) -> None:
+            """Confirm + execute the selected snippet."""
+            snip = self._current_snippet()
+            if not snip:
+                return
+
+            async def worker():
+                ok = await self.push_screen_wait(Confirm("Execute snippet now?"))
+                if not ok:
+                    return
+                _spawn_shell("/bin/zsh", snip)
+                # optional: surface the exit code in the UI
+            self.run_worker(worker(), exclusive=True)
+
+    return VmanTUI
 
 # ------------------------------ CLI entrypoint for TUI ------------------------------
 
@@ -1228,68 +2019,126 @@ class VmanTUI(App):
 def tui() -> None:
     """Open the interactive TUI to browse/add/edit commands."""
     if not HAS_TEXTUAL:
-        raise typer.Exit("TUI requires 'textual'. Install in your venv: pip install textual")
-    VmanTUI().run()
+        _die("TUI requires 'textual'. Install in your venv: pip install textual")
+    snip = _tui_app()().run()
+    if snip:  # `p` picked a snippet to print
+        _emit_snippet(snip.encode("utf-8"))
 
 # ------------------------------------------------------------
 # Optional: run a stored snippet (with confirm/copy)
 # ------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _snippets_sql(n_names: int) -> str:
+    # one statement per arity, so the connection's statement cache serves repeat calls
+    marks = ",".join("?" * n_names)
+    return f"""
+SELECT c.name, c.snippet, c.description
+FROM commands c JOIN tools t ON t.id = c.tool_id
+WHERE t.name = ? AND c.name IN ({marks})
+"""
+
+def _lookup_snippets(tool: str, names: List[str]) -> Dict[str, Tuple[str, str]]:
+    """name -> (snippet, description) for the names that exist, NULLs as "". Recently
+    run commands are answered from a small snapshot without opening the DB; it is
+    keyed by the same file stamp as the fuzzy catalog, so any write to the library
+    invalidates it. The rest are fetched in one IN (...) query."""
+    stamp = _db_stamp()
+    try:
+        with LOOKUP_CACHE.open("rb") as f:
+            cached_stamp, entries = pickle.load(f)
+        if cached_stamp != stamp:
+            entries = {}
+    except Exception:  # missing, truncated, or foreign: start over
+        entries = {}
+    found = {n: entries[(tool, n)] for n in names if (tool, n) in entries}
+    misses = list(dict.fromkeys(n for n in names if n not in found))
+    if not misses:
+        return found
+    sql, params = _snippets_sql(len(misses)), (tool, *misses)
+    rows = None
+    # reuse the process connection when something already opened it (TUI, embedding);
+    # a one-shot `vman run` only needs the cheap read-only one
+    if _CONN is None:
+        try:
+            conn = db_ro()
+        except sqlite3.OperationalError:  # no DB file yet: db() below creates it
+            conn = None
+        if conn is not None:
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError:  # e.g. still locked after busy_timeout
+                pass
+            finally:
+                if conn is not _CONN:
+                    conn.close()
+    if rows is None:
+        rows = db().execute(sql, params).fetchall()
+    if not rows:
+        # only a total miss pays for telling "no tool" from "no command"
+        with db() as conn:
+            if not get_tool_id(conn, tool):
+                _die(f"Tool '{tool}' not found.")
+    for n, snip, desc in rows:
+        entries[(tool, n)] = found[n] = (snip or "", desc or "")
+    if rows:
+        while len(entries) > LOOKUP_MAX:
+            del entries[next(iter(entries))]  # oldest insert first
+        _write_snapshot(LOOKUP_CACHE, (stamp, entries))
+    return found
+
 @app.command("run")
 def run_snippet(
     tool: str = typer.Argument(..., help="Tool name"),
-    name: str = typer.Argument(..., help="Command name"),
+    names: List[str] = typer.Argument(..., help="Command name(s); several are printed/run in order"),
     exec_: bool = typer.Option(False, "--exec", "-x", help="Execute the snippet instead of just printing it"),
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation when executing"),
     copy: bool = typer.Option(False, "--copy", "-c", help="Copy snippet to clipboard"),
     raw: bool = typer.Option(True, "--raw/--no-raw", help="Print raw snippet only (default)"),
     preview: bool = typer.Option(False, "--preview", help="Show a pretty panel before printing/executing"),
+    print0: bool = typer.Option(False, "--print0", "-0", help="End each printed snippet with NUL instead of newline"),
     shell: str = typer.Option("/bin/zsh", "--shell", help="Shell to execute under when using --exec"),
 ):
     """Default: print the stored snippet (easy to edit placeholders). Use --exec to actually run."""
-    with db() as conn:
-        tool_id = get_tool_id(conn, tool)
-        if not tool_id:
-            raise typer.Exit(f"Tool '{tool}' not found.")
-        row = conn.execute(
-            "SELECT snippet, description FROM commands WHERE tool_id=? AND name=?", (tool_id, name)
-        ).fetchone()
-        if not row:
-            raise typer.Exit(f"No command '{name}' for tool '{tool}'.")
-        snippet, desc = row
+    found = _lookup_snippets(tool, names)
+    for name in names:
+        if name not in found:
+            _die(f"No command '{name}' for tool '{tool}'.")
+    snippets = [found[n][0] for n in names]
+    # several names act as one script for --copy/--exec
+    snippet = "\n".join(snippets)
+    # encoded once; print and --copy share the bytes (join of one item is that item)
+    blobs = [s.encode("utf-8") for s in snippets]
 
     if preview:
-        console.print(Panel.fit(f"[bold]{tool}[/] · [bold]{name}[/]\n{desc or ''}"))
-        if not raw:
-            console.print(Syntax(snippet or "", "bash", word_wrap=True))
+        for name in names:
+            _print_banner(f"[bold]{tool}[/] · [bold]{name}[/]\n{found[name][1]}")
+            if not raw:
+                _print_syntax(found[name][0])
 
     # Always optionally copy
     if copy:
-        try:
-            subprocess.run(["pbcopy"], input=(snippet or "").encode(), check=True)
+        if _copy_clipboard(snippet, b"\n".join(blobs)):
             console.print("[dim]Snippet copied to clipboard.[/]")
-        except Exception:
+        else:
             console.print("[dim]Clipboard copy failed (pbcopy not available).[/]")
 
     # DEFAULT BEHAVIOR: print raw snippet and exit (no execution)
     if not exec_:
         # print just the snippet so you can edit placeholders quickly
-        sys.stdout.write((snippet or "") + ("\n" if not (snippet or "").endswith("\n") else ""))
+        _emit_snippets(blobs, end=b"\0" if print0 else b"\n")
         raise typer.Exit(0)
 
     # EXECUTION PATH (only when --exec/-x is provided)
     # Show snippet plainly once when not in raw mode and no preview was requested
     if not preview and not raw:
-        console.print(Syntax(snippet or "", "bash", word_wrap=True))
+        _print_syntax(snippet)
 
     if not yes:
-        if not typer.confirm("Run this command?", default=False):
+        if not _confirm("Run this command?"):
             raise typer.Exit(1)
 
-    try:
-        subprocess.run([shell, "-lc", snippet], check=True)
-    except subprocess.CalledProcessError as e:
-        raise typer.Exit(e.returncode)
+    _exec_shell(shell, snippet)
 
 # ------------------------------------------------------------
 # Main